@@ -6,49 +6,90 @@ This script provides various testing modes and options to run the complete
 test suite with different configurations and reporting options.
 """
 
+import functools
+import os
+import signal
 import sys
 import subprocess
 import argparse
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+
+# Each command runs in its own session so a timeout can reap its children too
+_POPEN = functools.partial(
+    subprocess.Popen,
+    stdout=subprocess.PIPE,
+    stderr=subprocess.PIPE,
+    text=True,
+    start_new_session=True
+)
 
 
 class TestRunner:
     """Manages test execution with various configurations."""
     
-    def __init__(self):
-        self.project_root = Path(__file__).parent
+    def __init__(self, quiet: bool = False, parallel: bool = False):
+        self.project_root = PROJECT_ROOT
+        self.quiet = quiet
+        self.parallel = parallel
         self.test_results: Dict[str, Any] = {}
+        self._output_lock = threading.Lock()
+        
+    @staticmethod
+    def _terminate_process_group(process: subprocess.Popen) -> None:
+        """Stop a timed-out command and any children it spawned (SIGTERM, then SIGKILL)."""
+        if os.name != 'posix':
+            process.kill()
+            return
         
-    def run_command(self, cmd: List[str], description: str) -> bool:
-        """Run a command and capture results."""
-        print(f"\n{'='*60}")
-        print(f"Running: {description}")
-        print(f"Command: {' '.join(cmd)}")
-        print('='*60)
+        try:
+            os.killpg(process.pid, signal.SIGTERM)
+            process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    
+    def run_command(self, cmd: List[str], description: str, timeout: int = 600) -> bool:
+        """Run a command and capture results, giving up after ``timeout`` seconds.
+
+        Output is buffered and printed as one block so commands run from
+        ``run_parallel`` do not interleave.
+        """
+        output = [
+            f"\n{'='*60}",
+            f"Running: {description}",
+            f"Command: {' '.join(cmd)}",
+            '='*60,
+        ]
         
         start_time = time.time()
         
         try:
-            result = subprocess.run(
-                cmd,
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                timeout=600  # 10 minute timeout
-            )
+            process = _POPEN(cmd, cwd=self.project_root)
+            try:
+                stdout, stderr = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                self._terminate_process_group(process)
+                process.communicate()
+                raise
+            result = subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
             
             execution_time = time.time() - start_time
             
-            print(f"Exit code: {result.returncode}")
-            print(f"Execution time: {execution_time:.2f} seconds")
+            output.append(f"Exit code: {result.returncode}")
+            output.append(f"Execution time: {execution_time:.2f} seconds")
             
             if result.stdout:
-                print(f"\nSTDOUT:\n{result.stdout}")
+                output.append(f"\nSTDOUT:\n{result.stdout}")
             
             if result.stderr:
-                print(f"\nSTDERR:\n{result.stderr}")
+                output.append(f"\nSTDERR:\n{result.stderr}")
             
             self.test_results[description] = {
                 'success': result.returncode == 0,
@@ -60,65 +101,107 @@ class TestRunner:
             return result.returncode == 0
             
         except subprocess.TimeoutExpired:
-            print(f"TIMEOUT: {description} took longer than 10 minutes")
+            output.append(f"TIMEOUT: {description} took longer than {timeout} seconds")
             self.test_results[description] = {
                 'success': False,
-                'execution_time': 600,
+                'execution_time': timeout,
                 'error': 'timeout'
             }
             return False
             
-        except Exception as e:
-            print(f"ERROR running {description}: {e}")
+        except OSError as e:
+            output.append(f"ERROR running {description}: {e}")
             self.test_results[description] = {
                 'success': False,
                 'execution_time': time.time() - start_time,
                 'error': str(e)
             }
             return False
+        
+        finally:
+            # In quiet mode a passing command only gets a one-line summary
+            if self.quiet and self.test_results.get(description, {}).get('success'):
+                output = [f"PASS: {description}"]
+            with self._output_lock:
+                print("\n".join(output), flush=True)
+    
+    def run_parallel(self, commands: List[Tuple[List[str], str, int]]) -> bool:
+        """Run independent ``(cmd, description, timeout)`` commands concurrently."""
+        max_workers = min(len(commands), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.run_command, cmd, description, timeout)
+                for cmd, description, timeout in commands
+            ]
+            results = [future.result() for future in futures]
+        
+        # Keep the report in submission order rather than completion order
+        for _, description, _ in commands:
+            self.test_results[description] = self.test_results.pop(description)
+        
+        return all(results)
     
     def run_linting(self) -> bool:
         """Run code linting checks."""
-        success = True
-        
-        # Flake8 linting
-        cmd = ['flake8', 'src/local_agents', 'tests', '--max-line-length=100', '--extend-ignore=E203,W503']
-        success &= self.run_command(cmd, "Code linting (flake8)")
-        
-        # Type checking
-        cmd = ['mypy', 'src/local_agents', '--ignore-missing-imports', '--check-untyped-defs']
-        success &= self.run_command(cmd, "Type checking (mypy)")
-        
-        # Black formatting check
-        cmd = ['black', '--check', 'src/local_agents', 'tests']
-        success &= self.run_command(cmd, "Code formatting check (black)")
-        
-        # isort import sorting check
-        cmd = ['isort', '--check-only', 'src/local_agents', 'tests']
-        success &= self.run_command(cmd, "Import sorting check (isort)")
-        
-        return success
+        return self.run_parallel([
+            (
+                [sys.executable, '-m', 'flake8', 'src/local_agents', 'tests', '--max-line-length=100', '--extend-ignore=E203,W503'],
+                "Code linting (flake8)",
+                120,
+            ),
+            (
+                [sys.executable, '-m', 'mypy', 'src/local_agents', '--ignore-missing-imports', '--check-untyped-defs'],
+                "Type checking (mypy)",
+                300,
+            ),
+            (
+                [sys.executable, '-m', 'black', '--check', 'src/local_agents', 'tests'],
+                "Code formatting check (black)",
+                120,
+            ),
+            (
+                [sys.executable, '-m', 'isort', '--check-only', 'src/local_agents', 'tests'],
+                "Import sorting check (isort)",
+                120,
+            ),
+        ])
     
     def run_security_checks(self) -> bool:
         """Run security vulnerability checks."""
-        success = True
-        
-        # Bandit security linting
-        cmd = ['bandit', '-r', 'src/local_agents', '-ll']
-        success &= self.run_command(cmd, "Security scanning (bandit)")
-        
-        # Safety dependency scanning
-        cmd = ['safety', 'check']
-        success &= self.run_command(cmd, "Dependency vulnerability scanning (safety)")
-        
-        return success
+        return self.run_parallel([
+            (
+                [sys.executable, '-m', 'bandit', '-r', 'src/local_agents', '-ll'],
+                "Security scanning (bandit)",
+                120,
+            ),
+            (
+                [sys.executable, '-m', 'safety', 'check'],
+                "Dependency vulnerability scanning (safety)",
+                120,
+            ),
+        ])
+    
+    def _xdist_args(self) -> List[str]:
+        """pytest-xdist options for parallel runs, keeping each test module on one worker.
+        
+        loadfile rather than loadscope: classes in one module share module-scoped
+        fixtures, which loadscope would rebuild on every worker that picks up
+        one of the module's classes. The performance lane uses loadgroup instead
+        so each agent's benchmarks get a worker, and the agents lane always
+        distributes its tests whether or not ``--parallel`` is given.
+        """
+        if not self.parallel:
+            return []
+        return ['-n', 'auto', '--dist=loadfile', '--max-worker-restart=0']
     
     def run_unit_tests(self, coverage: bool = True, verbose: bool = True) -> bool:
         """Run unit tests."""
-        cmd = ['pytest', 'tests/unit']
+        cmd = [sys.executable, '-m', 'pytest', 'tests/unit']
         
         if verbose:
             cmd.append('-v')
+        else:
+            cmd.extend(['-q', '--no-header'])
         
         if coverage:
             cmd.extend([
@@ -134,30 +217,39 @@ class TestRunner:
             '--durations=10'
         ])
         
+        cmd.extend(self._xdist_args())
+        
         return self.run_command(cmd, "Unit tests")
     
     def run_integration_tests(self, verbose: bool = True) -> bool:
         """Run integration tests."""
-        cmd = ['pytest', 'tests/integration']
+        cmd = [sys.executable, '-m', 'pytest', 'tests/integration']
         
         if verbose:
             cmd.append('-v')
+        else:
+            cmd.extend(['-q', '--no-header'])
         
+        # Hardware probes are left to the full suite
         cmd.extend([
             '--tb=short',
-            '-m', 'not slow',
+            '-m', 'not slow and not hardware',
             '--timeout=300',
             '--durations=10'
         ])
         
+        cmd.extend(self._xdist_args())
+        
         return self.run_command(cmd, "Integration tests")
     
     def run_performance_tests(self, verbose: bool = True) -> bool:
         """Run performance benchmarking tests."""
-        cmd = ['pytest', 'tests/performance']
+        cmd = [sys.executable, '-m', 'pytest', 'tests/performance']
         
         if verbose:
             cmd.append('-v')
+        else:
+            cmd.extend(['-q', '--no-header'])
         
         cmd.extend([
             '--tb=short',
@@ -166,42 +258,82 @@ class TestRunner:
             '--durations=10'
         ])
         
-        return self.run_command(cmd, "Performance benchmarks")
+        # Benchmarks are grouped per agent rather than per module
+        if self.parallel:
+            cmd.extend(['-n', 'auto', '--dist=loadgroup', '--max-worker-restart=0'])
+        
+        return self.run_command(cmd, "Performance benchmarks", timeout=1800)
     
     def run_cli_tests(self, verbose: bool = True) -> bool:
         """Run CLI integration tests."""
-        cmd = ['pytest', 'tests/integration/test_cli_integration.py']
+        cmd = [sys.executable, '-m', 'pytest', 'tests/integration/test_cli_integration.py']
         
         if verbose:
             cmd.append('-v')
+        else:
+            cmd.extend(['-q', '--no-header'])
         
         cmd.extend([
             '--tb=short',
             '--timeout=300'
         ])
         
+        cmd.extend(self._xdist_args())
+        
         return self.run_command(cmd, "CLI integration tests")
     
     def run_workflow_tests(self, verbose: bool = True) -> bool:
         """Run workflow orchestration tests."""
-        cmd = ['pytest', 'tests/integration/test_workflows.py', 'tests/unit/test_orchestrator.py']
+        cmd = [sys.executable, '-m', 'pytest', 'tests/integration/test_workflows.py', 'tests/unit/test_orchestrator.py']
         
         if verbose:
             cmd.append('-v')
+        else:
+            cmd.extend(['-q', '--no-header'])
         
         cmd.extend([
             '--tb=short',
             '--timeout=300'
         ])
         
+        cmd.extend(self._xdist_args())
+        
         return self.run_command(cmd, "Workflow tests")
     
-    def run_all_tests(self, skip_slow: bool = True, coverage: bool = True) -> bool:
+    def run_agent_tests(self, verbose: bool = True) -> bool:
+        """Run the agent unit tests, always spread across CPU cores.
+        
+        These tests only touch stub clients and ``tmp_path`` directories, so
+        they are safe to distribute even without ``--parallel``; the pytest
+        cache is skipped because this short lane gains nothing from it.
+        """
+        cmd = [sys.executable, '-m', 'pytest', 'tests/unit/test_agents']
+        
+        if verbose:
+            cmd.append('-v')
+        else:
+            cmd.extend(['-q', '--no-header'])
+        
+        cmd.extend([
+            '--tb=short',
+            '-p', 'no:cacheprovider',
+            '-n', 'auto',
+            '--dist=loadfile',
+            '--max-worker-restart=0'
+        ])
+        
+        return self.run_command(cmd, "Agent unit tests")
+    
+    def run_all_tests(self, skip_slow: bool = True, coverage: bool = True, verbose: bool = True) -> bool:
         """Run the complete test suite."""
-        cmd = ['pytest', 'tests/']
+        cmd = [sys.executable, '-m', 'pytest', 'tests/']
+        
+        if verbose:
+            cmd.append('-v')
+        else:
+            cmd.extend(['-q', '--no-header'])
         
         cmd.extend([
-            '-v',
             '--tb=short',
             '--timeout=600',
             '--durations=20'
@@ -219,7 +351,9 @@ class TestRunner:
                 '--cov-fail-under=80'
             ])
         
-        return self.run_command(cmd, "Complete test suite")
+        cmd.extend(self._xdist_args())
+        
+        return self.run_command(cmd, "Complete test suite", timeout=1800)
     
     def generate_report(self):
         """Generate a comprehensive test report."""
@@ -259,7 +393,7 @@ def main():
     
     parser.add_argument(
         '--mode',
-        choices=['quick', 'full', 'unit', 'integration', 'performance', 'lint', 'security', 'cli', 'workflow'],
+        choices=['quick', 'full', 'unit', 'integration', 'performance', 'lint', 'security', 'cli', 'workflow', 'agents'],
         default='quick',
         help='Test mode to run (default: quick)'
     )
@@ -276,6 +410,12 @@ def main():
         help='Include slow tests in execution'
     )
     
+    parser.add_argument(
+        '--parallel',
+        action='store_true',
+        help='Spread tests across CPU cores with pytest-xdist (benchmarks are split per agent)'
+    )
+    
     parser.add_argument(
         '--quiet',
         action='store_true',
@@ -284,7 +424,7 @@ def main():
     
     args = parser.parse_args()
     
-    runner = TestRunner()
+    runner = TestRunner(quiet=args.quiet, parallel=args.parallel)
     overall_success = True
     
     print("Starting Local Agents Test Suite")
@@ -316,6 +456,9 @@ def main():
     elif args.mode == 'workflow':
         overall_success = runner.run_workflow_tests(verbose=not args.quiet)
         
+    elif args.mode == 'agents':
+        overall_success = runner.run_agent_tests(verbose=not args.quiet)
+        
     elif args.mode == 'quick':
         # Quick test suite: linting + unit tests + basic integration
         overall_success &= runner.run_linting()
@@ -331,7 +474,8 @@ def main():
         overall_success &= runner.run_security_checks()
         overall_success &= runner.run_all_tests(
             skip_slow=not args.include_slow,
-            coverage=not args.no_coverage
+            coverage=not args.no_coverage,
+            verbose=not args.quiet
         )
         overall_success &= runner.run_performance_tests(verbose=not args.quiet)
     
@@ -27,83 +27,62 @@ from .workflows.orchestrator import Workflow
 console = Console()
 
 
+def display_error_panel(heading: str, message: str, title: str) -> None:
+    """Render an error panel with a red heading above the message."""
+    console.print(Panel(f"[red]{heading}[/red]\n\n{message}", title=title, border_style="red"))
+
+
 def handle_common_errors(e: Exception) -> None:
     """Handle common exceptions with user-friendly error messages."""
     if isinstance(e, ConnectionError):
-        console.print(
-            Panel(
-                "[red]Connection Error[/red]\n\n"
-                "Cannot connect to Ollama. Please ensure:\n"
-                "• Ollama is installed and running\n"
-                "• The service is accessible at the configured host\n"
-                "• No firewall is blocking the connection\n\n"
-                "Run: [cyan]ollama serve[/cyan] to start Ollama",
-                title="Connection Failed",
-                border_style="red",
-            )
+        display_error_panel(
+            "Connection Error",
+            "Cannot connect to Ollama. Please ensure:\n"
+            "• Ollama is installed and running\n"
+            "• The service is accessible at the configured host\n"
+            "• No firewall is blocking the connection\n\n"
+            "Run: [cyan]ollama serve[/cyan] to start Ollama",
+            "Connection Failed",
         )
     elif isinstance(e, TimeoutError):
-        console.print(
-            Panel(
-                "[red]Request Timeout[/red]\n\n"
-                "The request to Ollama timed out. This might be because:\n"
-                "• The model is too large for your system\n"
-                "• Ollama is busy with other requests\n"
-                "• Your task is very complex\n\n"
-                "Try using a smaller model or breaking down the task.",
-                title="Timeout Error",
-                border_style="red",
-            )
+        display_error_panel(
+            "Request Timeout",
+            "The request to Ollama timed out. This might be because:\n"
+            "• The model is too large for your system\n"
+            "• Ollama is busy with other requests\n"
+            "• Your task is very complex\n\n"
+            "Try using a smaller model or breaking down the task.",
+            "Timeout Error",
         )
     elif isinstance(e, ModelNotAvailableError):
-        console.print(
-            Panel(
-                f"[red]Model Not Available[/red]\n\n"
-                f"{e}\n\n"
-                "Use: [cyan]ollama pull <model-name>[/cyan] to download the model",
-                title="Model Error",
-                border_style="red",
-            )
+        display_error_panel(
+            "Model Not Available",
+            f"{e}\n\nUse: [cyan]ollama pull <model-name>[/cyan] to download the model",
+            "Model Error",
         )
     elif isinstance(e, FileOperationError):
-        console.print(
-            Panel(
-                f"[red]File Operation Failed[/red]\n\n"
-                f"{e}\n\n"
-                "Please check file permissions and paths.",
-                title="File Error",
-                border_style="red",
-            )
+        display_error_panel(
+            "File Operation Failed",
+            f"{e}\n\nPlease check file permissions and paths.",
+            "File Error",
         )
     elif isinstance(e, WorkflowError):
-        console.print(
-            Panel(
-                f"[red]Workflow Error[/red]\n\n"
-                f"{e}\n\n"
-                "Please check your workflow configuration and try again.",
-                title="Workflow Failed",
-                border_style="red",
-            )
+        display_error_panel(
+            "Workflow Error",
+            f"{e}\n\nPlease check your workflow configuration and try again.",
+            "Workflow Failed",
         )
     elif isinstance(e, AgentExecutionError):
-        console.print(
-            Panel(
-                f"[red]Agent Execution Error[/red]\n\n"
-                f"{e}\n\n"
-                "The agent encountered an error during execution.",
-                title="Agent Error",
-                border_style="red",
-            )
+        display_error_panel(
+            "Agent Execution Error",
+            f"{e}\n\nThe agent encountered an error during execution.",
+            "Agent Error",
         )
     else:
-        console.print(
-            Panel(
-                f"[red]Unexpected Error[/red]\n\n"
-                f"{e}\n\n"
-                + ("If this problem persists, please check your configuration " "and try again."),
-                title="Error",
-                border_style="red",
-            )
+        display_error_panel(
+            "Unexpected Error",
+            f"{e}\n\nIf this problem persists, please check your configuration and try again.",
+            "Error",
         )
 
 
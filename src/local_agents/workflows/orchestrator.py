@@ -1,9 +1,10 @@
 """Workflow orchestrator for managing multi-agent workflows."""
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
 from rich.console import Console
 from rich.panel import Panel
@@ -19,6 +20,33 @@ from ..config import config_manager
 
 console = Console()
 
+# Built-in workflow step specs: (agent_type, description, depends_on, context_mapping)
+_BUILTIN_WORKFLOWS: Dict[str, Tuple[Tuple[str, str, Tuple[str, ...], Dict[str, str]], ...]] = {
+    "feature-dev": (
+        ("plan", "Create implementation plan", (), {}),
+        ("code", "Generate code implementation", ("plan",), {"plan_output": "implementation_plan"}),
+        ("test", "Create and run tests", ("code",), {"code_output": "code_to_test"}),
+        ("review", "Review implementation", ("code",), {"code_output": "code_to_review"}),
+    ),
+    "bug-fix": (
+        ("plan", "Analyze bug and create fix plan", (), {}),
+        ("code", "Implement bug fix", ("plan",), {"plan_output": "fix_plan"}),
+        ("test", "Test bug fix", ("code",), {"code_output": "fixed_code"}),
+    ),
+    "code-review": (("review", "Comprehensive code review", (), {}),),
+    "refactor": (
+        ("plan", "Create refactoring plan", (), {}),
+        ("code", "Implement refactoring", ("plan",), {"plan_output": "refactor_plan"}),
+        ("test", "Test refactored code", ("code",), {"code_output": "refactored_code"}),
+        (
+            "review",
+            "Review refactored implementation",
+            ("code",),
+            {"code_output": "code_to_review"},
+        ),
+    ),
+}
+
 
 @dataclass
 class WorkflowResult:
@@ -163,11 +191,15 @@ class WorkflowStep:
         description: str,
         depends_on: Optional[List[str]] = None,
         context_mapping: Optional[Dict[str, str]] = None,
+        runs_after: Optional[List[str]] = None,
     ) -> None:
         self.agent_type = agent_type
         self.description = description
         self.depends_on = depends_on or []
         self.context_mapping = context_mapping or {}
+        # Like depends_on for grouping concurrent steps, but a failure of these
+        # steps does not skip this one
+        self.runs_after = runs_after or []
         self.result: Optional[TaskResult] = None
         self.completed = False
 
@@ -235,9 +267,14 @@ class Workflow:
         task: str,
         initial_context: Optional[Dict[str, Any]] = None,
         stream: bool = False,
-        enable_parallel: bool = True,
+        enable_parallel: bool = False,
     ) -> WorkflowResult:
-        """Execute a predefined workflow."""
+        """Execute a predefined workflow.
+
+        With ``enable_parallel`` (and ``performance.enable_parallel_workflows`` left on),
+        steps that only depend on completed work run together on a thread pool. Grouped
+        steps do not see each other's output, so review then runs without the test results.
+        """
         start_time = time.time()
 
         # Store initial context copy for result
@@ -276,36 +313,61 @@ class Workflow:
                 total=len(workflow_steps),
             )
 
-            for i, step in enumerate(workflow_steps, 1):
-                console.print(f"\n[bold]Step {i}/{len(workflow_steps)}: {step.description}[/bold]")
+            # Concurrency is opt-in: steps that only depend on already completed work
+            # (test and review after code) are handed to a thread pool together.
+            # Streamed output would interleave, so streaming keeps the sequential path.
+            run_parallel = (
+                enable_parallel
+                and not stream
+                and self.max_concurrent_agents > 1
+                and config_manager.load_config().performance.enable_parallel_workflows
+            )
+            position = 0
+            aborted = False
+
+            while position < len(workflow_steps) and not aborted:
+                if run_parallel:
+                    group = self._get_ready_step_group(workflow_steps, position, results)
+                else:
+                    group = [workflow_steps[position]]
+                first_step_number = position + 1
+                position += len(group)
+
+                for i, step in enumerate(group, first_step_number):
+                    console.print(
+                        f"\n[bold]Step {i}/{len(workflow_steps)}: {step.description}[/bold]"
+                    )
 
                 # Check dependencies
-                if not self._check_dependencies(step, results):
+                if len(group) == 1 and not self._check_dependencies(group[0], results):
                     console.print("[red]Skipping step due to failed dependencies[/red]")
                     continue
 
-                # Execute step
-                result = self._execute_step(step, task, None, stream)
-                results.append(result)
+                # Execute steps
+                group_results = self._execute_step_group(group, task, stream)
 
-                # Update context with results
-                self._update_context_from_result(step, result)
+                for i, (step, result) in enumerate(zip(group, group_results), first_step_number):
+                    results.append(result)
 
-                # Track completed steps
-                if result.success:
-                    self.completed_steps[step.agent_type] = True
+                    # Update context with results
+                    self._update_context_from_result(step, result)
 
-                if result.success:
-                    console.print(f"[green]✓ Step {i} completed successfully[/green]")
-                else:
-                    console.print(f"[red]✗ Step {i} failed: {result.error}[/red]")
+                    # Track completed steps
+                    if result.success:
+                        self.completed_steps[step.agent_type] = True
+
+                    if result.success:
+                        console.print(f"[green]✓ Step {i} completed successfully[/green]")
+                    else:
+                        console.print(f"[red]✗ Step {i} failed: {result.error}[/red]")
 
-                    # Decide whether to continue or abort
-                    if not self._should_continue_after_failure(step, result):
-                        console.print("[red]Workflow aborted due to critical failure[/red]")
-                        break
+                        # Decide whether to continue or abort
+                        if not self._should_continue_after_failure(step, result):
+                            console.print("[red]Workflow aborted due to critical failure[/red]")
+                            aborted = True
+                            break
 
-                progress.advance(workflow_task)
+                    progress.advance(workflow_task)
 
         # Calculate execution time
         execution_time = time.time() - start_time
@@ -330,73 +392,33 @@ class Workflow:
 
     def _get_workflow_definition(self, workflow_name: str) -> List[WorkflowStep]:
         """Get the definition for a predefined workflow."""
-        workflows = {
-            "feature-dev": [
-                WorkflowStep("plan", "Create implementation plan"),
-                WorkflowStep(
-                    "code",
-                    "Generate code implementation",
-                    depends_on=["plan"],
-                    context_mapping={"plan_output": "implementation_plan"},
-                ),
-                WorkflowStep(
-                    "test",
-                    "Create and run tests",
-                    depends_on=["code"],
-                    context_mapping={"code_output": "code_to_test"},
-                ),
-                WorkflowStep(
-                    "review",
-                    "Review implementation",
-                    depends_on=["code"],
-                    context_mapping={"code_output": "code_to_review"},
-                ),
-            ],
-            "bug-fix": [
-                WorkflowStep("plan", "Analyze bug and create fix plan"),
-                WorkflowStep(
-                    "code",
-                    "Implement bug fix",
-                    depends_on=["plan"],
-                    context_mapping={"plan_output": "fix_plan"},
-                ),
-                WorkflowStep(
-                    "test",
-                    "Test bug fix",
-                    depends_on=["code"],
-                    context_mapping={"code_output": "fixed_code"},
-                ),
-            ],
-            "code-review": [WorkflowStep("review", "Comprehensive code review")],
-            "refactor": [
-                WorkflowStep("plan", "Create refactoring plan"),
-                WorkflowStep(
-                    "code",
-                    "Implement refactoring",
-                    depends_on=["plan"],
-                    context_mapping={"plan_output": "refactor_plan"},
-                ),
-                WorkflowStep(
-                    "test",
-                    "Test refactored code",
-                    depends_on=["code"],
-                    context_mapping={"code_output": "refactored_code"},
-                ),
-                WorkflowStep(
-                    "review",
-                    "Review refactored implementation",
-                    depends_on=["code"],
-                    context_mapping={"code_output": "code_to_review"},
-                ),
-            ],
-        }
+        builtin_specs = _BUILTIN_WORKFLOWS.get(workflow_name, ())
 
         # Also check user-configured workflows
         config_workflows = config_manager.get_workflow_steps(workflow_name)
         if config_workflows:
-            return [WorkflowStep(step, f"Execute {step} agent") for step in config_workflows]
+            # Configured steps run after the built-in dependencies configured before them,
+            # so independent steps (test and review after code) can still run as a group,
+            # but they keep running after a non-critical failure
+            builtin_depends_on = {spec[0]: spec[2] for spec in builtin_specs}
+            return [
+                WorkflowStep(
+                    step,
+                    f"Execute {step} agent",
+                    runs_after=[
+                        dep
+                        for dep in builtin_depends_on.get(step, ())
+                        if dep in config_workflows[:i]
+                    ],
+                )
+                for i, step in enumerate(config_workflows)
+            ]
 
-        return workflows.get(workflow_name, [])
+        # Steps record their results, so every run gets fresh instances
+        return [
+            WorkflowStep(agent_type, description, list(depends_on), dict(context_mapping))
+            for agent_type, description, depends_on, context_mapping in builtin_specs
+        ]
 
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get workflow execution performance statistics."""
@@ -609,6 +631,53 @@ class Workflow:
                 execution_time=time.time() - step_start_time,
             )
 
+    def _get_ready_step_group(
+        self,
+        workflow_steps: List[WorkflowStep],
+        position: int,
+        completed_results: List[TaskResult],
+    ) -> List[WorkflowStep]:
+        """Collect the consecutive steps starting at ``position`` that can run together.
+
+        A step joins the group when its ``depends_on`` and ``runs_after`` steps have
+        all succeeded in ``completed_results`` and none of them is another step in
+        the group. Steps with neither run on their own, in definition order. The
+        group never exceeds ``max_concurrent_agents``.
+        """
+        succeeded = {result.agent_type for result in completed_results if result.success}
+
+        def is_ready(step: WorkflowStep) -> bool:
+            prerequisites = step.depends_on + step.runs_after
+            return bool(prerequisites) and succeeded.issuperset(prerequisites)
+
+        first_step = workflow_steps[position]
+        group = [first_step]
+        if not is_ready(first_step):
+            return group
+
+        for step in workflow_steps[position + 1 :]:
+            if len(group) >= self.max_concurrent_agents:
+                break
+            group_types = {member.agent_type for member in group}
+            if not is_ready(step) or group_types.intersection(step.depends_on + step.runs_after):
+                break
+            group.append(step)
+
+        return group
+
+    def _execute_step_group(
+        self, group: List[WorkflowStep], main_task: str, stream: bool = False
+    ) -> List[TaskResult]:
+        """Execute a group of independent steps, returning results in step order."""
+        if len(group) == 1:
+            return [self._execute_step(group[0], main_task, None, stream)]
+
+        self.execution_stats["concurrent_executions"] += 1
+        with ThreadPoolExecutor(max_workers=len(group)) as executor:
+            return list(
+                executor.map(lambda step: self._execute_step(step, main_task, None, stream), group)
+            )
+
     def _customize_task_for_step(self, step: WorkflowStep, main_task: str) -> str:
         """Customize the task description for a specific step."""
         task_templates = {
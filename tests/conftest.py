@@ -1,22 +1,68 @@
 """Pytest configuration and shared fixtures."""
 
-import shutil
-import tempfile
 from pathlib import Path
+from types import MappingProxyType
 from unittest.mock import Mock
 
 import pytest
 
-from local_agents.agents.planner import PlanningAgent
-from local_agents.base import TaskResult
-from local_agents.config import Config
-from local_agents.ollama_client import OllamaClient
+
+def pytest_configure(config):
+    """Register markers used across the test suite."""
+    config.addinivalue_line(
+        "markers", "hardware: Tests probing the real machine (psutil, platform, sockets)"
+    )
+    config.addinivalue_line(
+        "markers", "performance: Performance benchmarks (deselected unless -m names them)"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Deselect ``performance`` benchmarks unless the ``-m`` expression names them.
+
+    Unrelated expressions such as ``-m "not slow"`` keep the benchmarks out.
+    """
+    if "performance" in config.option.markexpr:
+        return
+
+    selected, deselected = [], []
+    for item in items:
+        (deselected if item.get_closest_marker("performance") else selected).append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_working_directory(tmp_path_factory):
+    """Run the session from a scratch directory.
+
+    Agents write their output (``code.py``, ``plans/``, ``code_review.md``, ...)
+    relative to the working directory; keep those files out of the project root
+    and away from other xdist workers. A single chdir per session is enough.
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.chdir(tmp_path_factory.mktemp("cwd"))
+        yield
+
+
+@pytest.fixture(scope="session")
+def _ollama_mock_template():
+    """Build the spec'd Ollama client mock once per session."""
+    from local_agents.ollama_client import OllamaClient
+
+    return Mock(spec=OllamaClient)
 
 
 @pytest.fixture
-def mock_ollama_client():
-    """Create a mock Ollama client for testing."""
-    client = Mock(spec=OllamaClient)
+def mock_ollama_client(_ollama_mock_template):
+    """Create a mock Ollama client for testing.
+
+    The spec'd mock is shared across the session and reset here, so calls,
+    return values and side effects never leak between tests.
+    """
+    client = _ollama_mock_template
+    client.reset_mock(return_value=True, side_effect=True)
     client.is_model_available.return_value = True
     client.pull_model.return_value = True
     client.generate.return_value = "Mock response"
@@ -28,6 +74,8 @@ def mock_ollama_client():
 @pytest.fixture
 def test_config():
     """Create a test configuration."""
+    from local_agents.config import Config
+
     return Config(
         default_model="test:model",
         ollama_host="http://localhost:11434",
@@ -42,19 +90,13 @@ def test_context():
     return {"_test_mode": True}
 
 
-@pytest.fixture
-def temp_directory():
-    """Create a temporary directory for testing."""
-    temp_dir = tempfile.mkdtemp()
-    yield Path(temp_dir)
-    shutil.rmtree(temp_dir)
+@pytest.fixture(scope="session")
+def session_temp_directory(tmp_path_factory):
+    """Create a temporary directory shared by the read-only sample fixtures."""
+    return tmp_path_factory.mktemp("samples_session")
 
 
-@pytest.fixture
-def sample_python_file(temp_directory):
-    """Create a sample Python file for testing."""
-    file_path = temp_directory / "sample.py"
-    content = '''"""Sample Python module for testing."""
+_SAMPLE_PY = '''"""Sample Python module for testing."""
 
 def calculate_sum(a, b):
     """Calculate the sum of two numbers."""
@@ -76,16 +118,27 @@ class Calculator:
     def get_history(self):
         """Get calculation history."""
         return self.history
-'''
-    file_path.write_text(content)
+'''.encode()
+
+
+@pytest.fixture(scope="session")
+def sample_python_file(session_temp_directory):
+    """Create a sample Python file for testing.
+
+    The file is shared across the session and must be treated as read-only.
+    """
+    file_path = session_temp_directory / "sample.py"
+    file_path.write_bytes(_SAMPLE_PY)
     return file_path
 
 
-@pytest.fixture
-def sample_javascript_file(temp_directory):
-    """Create a sample JavaScript file for testing."""
-    file_path = temp_directory / "sample.js"
-    content = """// Sample JavaScript module for testing
+@pytest.fixture(scope="session")
+def sample_python_text(sample_python_file):
+    """Provide the contents of the sample Python file, read once per session."""
+    return sample_python_file.read_text()
+
+
+_SAMPLE_JS = """// Sample JavaScript module for testing
 
 function calculateSum(a, b) {
     return a + b;
@@ -108,20 +161,18 @@ class Calculator {
 }
 
 module.exports = { calculateSum, Calculator };
-"""
-    file_path.write_text(content)
-    return file_path
+""".encode()
 
 
-@pytest.fixture
-def sample_project_directory(temp_directory):
-    """Create a sample project directory structure."""
-    project_dir = temp_directory / "sample_project"
-    project_dir.mkdir()
+@pytest.fixture(scope="session")
+def sample_javascript_file(session_temp_directory):
+    """Create a sample JavaScript file for testing."""
+    file_path = session_temp_directory / "sample.js"
+    file_path.write_bytes(_SAMPLE_JS)
+    return file_path
 
-    # Create package.json
-    (project_dir / "package.json").write_text(
-        """{
+
+_PACKAGE_JSON = """{
     "name": "sample-project",
     "version": "1.0.0",
     "scripts": {
@@ -132,23 +183,15 @@ def sample_project_directory(temp_directory):
         "jest": "^28.0.0",
         "eslint": "^8.0.0"
     }
-}"""
-    )
-
-    # Create source directory
-    src_dir = project_dir / "src"
-    src_dir.mkdir()
+}""".encode()
 
-    (src_dir / "index.js").write_text(
-        """const { Calculator } = require('./calculator');
+_INDEX_JS = """const { Calculator } = require('./calculator');
 
 const calc = new Calculator();
 console.log(calc.add(2, 3));
-"""
-    )
+""".encode()
 
-    (src_dir / "calculator.js").write_text(
-        """class Calculator {
+_CALCULATOR_JS = """class Calculator {
     constructor() {
         this.history = [];
     }
@@ -161,15 +204,9 @@ console.log(calc.add(2, 3));
 }
 
 module.exports = { Calculator };
-"""
-    )
+""".encode()
 
-    # Create tests directory
-    tests_dir = project_dir / "__tests__"
-    tests_dir.mkdir()
-
-    (tests_dir / "calculator.test.js").write_text(
-        """const { Calculator } = require('../src/calculator');
+_CALCULATOR_TEST_JS = """const { Calculator } = require('../src/calculator');
 
 describe('Calculator', () => {
     test('should add two numbers', () => {
@@ -177,21 +214,33 @@ describe('Calculator', () => {
         expect(calc.add(2, 3)).toBe(5);
     });
 });
-"""
-    )
+""".encode()
 
-    return project_dir
 
+_SAMPLE_PROJECT_FILES = {
+    "package.json": _PACKAGE_JSON,
+    "src/index.js": _INDEX_JS,
+    "src/calculator.js": _CALCULATOR_JS,
+    "__tests__/calculator.test.js": _CALCULATOR_TEST_JS,
+}
 
-@pytest.fixture
-def sample_python_project(temp_directory):
-    """Create a sample Python project directory structure."""
-    project_dir = temp_directory / "python_project"
-    project_dir.mkdir()
 
-    # Create pyproject.toml
-    (project_dir / "pyproject.toml").write_text(
-        """[build-system]
+@pytest.fixture(scope="session")
+def sample_project_directory(session_temp_directory):
+    """Create a sample project directory structure."""
+    project_dir = session_temp_directory / "sample_project"
+
+    # Create each leaf directory once, then write the files into them
+    for leaf_dir in {Path(name).parent for name in _SAMPLE_PROJECT_FILES}:
+        (project_dir / leaf_dir).mkdir(parents=True, exist_ok=True)
+
+    for name, content in _SAMPLE_PROJECT_FILES.items():
+        (project_dir / name).write_bytes(content)
+
+    return project_dir
+
+
+_PYPROJECT_TOML = """[build-system]
 requires = ["setuptools", "wheel"]
 
 [tool.pytest.ini_options]
@@ -199,17 +248,9 @@ testpaths = ["tests"]
 
 [tool.black]
 line-length = 88
-"""
-    )
-
-    # Create source directory
-    src_dir = project_dir / "src" / "mypackage"
-    src_dir.mkdir(parents=True)
-
-    (src_dir / "__init__.py").write_text("")
+""".encode()
 
-    (src_dir / "calculator.py").write_text(
-        '''"""Calculator module."""
+_CALCULATOR_PY = '''"""Calculator module."""
 
 class Calculator:
     """A simple calculator."""
@@ -226,17 +267,9 @@ class Calculator:
     def get_history(self):
         """Get calculation history."""
         return self.history
-'''
-    )
-
-    # Create tests directory
-    tests_dir = project_dir / "tests"
-    tests_dir.mkdir()
-
-    (tests_dir / "__init__.py").write_text("")
+'''.encode()
 
-    (tests_dir / "test_calculator.py").write_text(
-        '''"""Tests for calculator module."""
+_TEST_CALCULATOR_PY = '''"""Tests for calculator module."""
 
 import pytest
 from src.mypackage.calculator import Calculator
@@ -248,16 +281,39 @@ def test_calculator_add():
     result = calc.add(2, 3)
     assert result == 5
     assert len(calc.get_history()) == 1
-'''
-    )
+'''.encode()
+
+
+@pytest.fixture(scope="session")
+def sample_python_project(session_temp_directory):
+    """Create a sample Python project directory structure."""
+    project_dir = session_temp_directory / "python_project"
+    project_dir.mkdir()
+
+    # Create pyproject.toml
+    (project_dir / "pyproject.toml").write_bytes(_PYPROJECT_TOML)
+
+    # Create source directory
+    src_dir = project_dir / "src" / "mypackage"
+    src_dir.mkdir(parents=True)
+
+    (src_dir / "__init__.py").write_bytes(b"")
+
+    (src_dir / "calculator.py").write_bytes(_CALCULATOR_PY)
+
+    # Create tests directory
+    tests_dir = project_dir / "tests"
+    tests_dir.mkdir()
+
+    (tests_dir / "__init__.py").write_bytes(b"")
+
+    (tests_dir / "test_calculator.py").write_bytes(_TEST_CALCULATOR_PY)
 
     return project_dir
 
 
-@pytest.fixture
-def mock_ollama_responses():
-    """Provide realistic AI model responses for different agent types."""
-    return {
+_MOCK_OLLAMA_RESPONSES = MappingProxyType(
+    {
         "plan": """# Implementation Plan
 
 ## Requirements Analysis
@@ -391,23 +447,10 @@ This code demonstrates good practices but has areas for improvement.
 
 ## Overall Rating: B+ (Good)""",
     }
+)
 
 
-@pytest.fixture
-def comprehensive_mock_agents():
-    """Create comprehensive mock agents for testing workflows."""
-    agents = {}
-
-    # Create mock planning agent
-    mock_planner = Mock(spec=PlanningAgent)
-    mock_planner.agent_type = "plan"
-    mock_planner.execute.return_value = TaskResult(
-        success=True,
-        output=("# Implementation Plan\n\n## Phase 1: Core Setup\n" "- Set up project structure"),
-        agent_type="plan",
-        task="Create implementation plan",
-        context={},
-    )
-    agents["planner"] = mock_planner
-
-    return agents
+@pytest.fixture(scope="session")
+def mock_ollama_responses():
+    """Provide realistic AI model responses for different agent types."""
+    return _MOCK_OLLAMA_RESPONSES
@@ -0,0 +1,30 @@
+"""Shared fixtures for the integration tests."""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def loaded_config():
+    """Load the application configuration once per session.
+
+    The config object is shared; tests must not mutate it.
+    """
+    from local_agents.config import config_manager
+
+    return config_manager.load_config()
+
+
+@pytest.fixture(scope="session")
+def hw_profile():
+    """Detect the best hardware profile once per session."""
+    from local_agents.hardware import hardware_optimizer
+
+    return hardware_optimizer.detect_best_profile()
+
+
+@pytest.fixture(scope="session")
+def hw_info():
+    """Provide the detected hardware information."""
+    from local_agents.hardware import hardware_optimizer
+
+    return hardware_optimizer.detected_hardware
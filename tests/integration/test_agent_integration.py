@@ -1,21 +1,41 @@
 """Integration tests for agent interactions."""
 
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
 from unittest.mock import Mock, patch
 
 import pytest
 
-from local_agents.agents.coder import CodingAgent
-from local_agents.agents.planner import PlanningAgent
-from local_agents.agents.reviewer import ReviewAgent
-from local_agents.agents.tester import TestingAgent
-from local_agents.ollama_client import OllamaClient
-
-
-@pytest.fixture
-def mock_ollama_response():
-    """Mock Ollama responses for different agents."""
-    responses = {
-        "plan": """# Implementation Plan
+pytestmark = pytest.mark.xdist_group("agent_integration")
+
+# Patterns checked in priority order; the first one found selects the response
+_PROMPT_ROUTES = (
+    (re.compile(r"Test Generation Task|QA Engineer|test suites"), "test"),
+    (re.compile(r"Code Generation Task"), "code"),
+    (re.compile(r"Code Review"), "review"),
+    (re.compile(r"Planning"), "plan"),
+)
+_MODEL_ROUTES = (
+    ("planner", "plan"),
+    ("codellama", "code"),
+    ("review", "review"),
+)
+
+# Read-only contexts shared by tests; agents copy the context before adding to it
+_PY_CTX = MappingProxyType({"language": "python"})
+_PY_FUNC_CTX = MappingProxyType({"language": "python", "style": "functional"})
+_CHAIN_CTX = MappingProxyType({"language": "python", "requirements": "basic arithmetic operations"})
+
+# Interned once at import; mocked calls return these objects without copying
+_RESPONSES: Mapping[str, str] = MappingProxyType(
+    {
+        key: sys.intern(text)
+        for key, text in {
+            "plan": """# Implementation Plan
 
 ## Requirements Analysis
 - Create a simple calculator function
@@ -33,7 +53,7 @@ def mock_ollama_response():
 - Use functional approach for simplicity
 - Implement type hints for better code quality
 - Include comprehensive error handling""",
-        "code": """```python
+            "code": """```python
 def calculator(operation: str, a: float, b: float) -> float:
     \"\"\"Perform basic arithmetic operations.
 
@@ -61,7 +81,7 @@ def calculator(operation: str, a: float, b: float) -> float:
     else:
         raise ValueError(f"Unsupported operation: {operation}")
 ```""",
-        "test": """```python
+            "test": """```python
 import pytest
 from calculator import calculator
 
@@ -102,7 +122,7 @@ def test_calculator_invalid_operation():
     with pytest.raises(ValueError, match="Unsupported operation"):
         calculator('%', 10, 3)
 ```""",
-        "review": """# Code Review Report
+            "review": """# Code Review Report
 
 ## Summary
 The calculator function is well-implemented with proper error handling,
@@ -133,183 +153,223 @@ best practices.
 ## Performance Notes
 - Performance is optimal for the use case
 - No optimization needed for this simple function""",
+        }.items()
     }
+)
+
+
+@lru_cache(maxsize=64)
+def _route_response(model: str, prompt: str) -> str:
+    """Pick the canned response for a prompt; repeated prompts are a cache hit."""
+    # Determine response based on prompt content first (more reliable)
+    for pattern, key in _PROMPT_ROUTES:
+        if pattern.search(prompt):
+            return _RESPONSES[key]
+    # Fallback to model name matching
+    model_name = model.lower()
+    for marker, key in _MODEL_ROUTES:
+        if marker in model_name:
+            return _RESPONSES[key]
+    return _RESPONSES["plan"]  # Default
+
+
+@pytest.fixture(scope="module")
+def mock_ollama_response():
+    """Mock Ollama responses for different agents."""
 
     def mock_generate(model, prompt, **kwargs):
-        # Determine response based on prompt content first (more reliable)
-        if "Test Generation Task" in prompt or "QA Engineer" in prompt or "test suites" in prompt:
-            return responses["test"]
-        elif "Code Generation Task" in prompt:
-            return responses["code"]
-        elif "Code Review Task" in prompt or "Code Review" in prompt:
-            return responses["review"]
-        elif "Planning" in prompt:
-            return responses["plan"]
-        # Fallback to model name matching
-        elif "planner" in model.lower():
-            return responses["plan"]
-        elif "codellama" in model.lower():
-            return responses["code"]
-        elif "review" in model.lower():
-            return responses["review"]
-        else:
-            return responses["plan"]  # Default
+        # OllamaClient.generate joins streamed chunks itself and returns text even when
+        # stream=True, so the mock returns the full response in both modes
+        return _route_response(model, prompt)
 
     return mock_generate
 
 
-@pytest.fixture
+class _CallRecorder:
+    """Callable that records ``(args, kwargs)`` for each call before delegating."""
+
+    def __init__(self, fn):
+        self.fn = fn
+        self.calls = []
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.fn(*args, **kwargs)
+
+    def reset_mock(self):
+        """Forget recorded calls."""
+        self.calls.clear()
+
+
+class _FakeOllamaClient:
+    """Lightweight stand-in exposing only the OllamaClient methods agents call."""
+
+    def __init__(self, generate):
+        self.generate = _CallRecorder(generate)
+        self.chat = _CallRecorder(generate)
+        self.is_model_available = Mock(return_value=True)
+        self.pull_model = Mock(return_value=True)
+        self.list_models = Mock(return_value=["llama3.1:8b", "codellama:7b"])
+
+    def reset_mock(self):
+        """Clear recorded calls while keeping configured responses."""
+        for method in vars(self).values():
+            method.reset_mock()
+
+
+@pytest.fixture(scope="module")
 def mock_ollama_client_with_responses(mock_ollama_response):
-    """Create mock Ollama client with realistic responses."""
-    client = Mock(spec=OllamaClient)
-    client.is_model_available.return_value = True
-    client.pull_model.return_value = True
-    client.generate.side_effect = mock_ollama_response
-    client.chat.side_effect = mock_ollama_response
-    client.list_models.return_value = ["llama3.1:8b", "codellama:7b"]
-    return client
+    """Create mock Ollama client with realistic responses.
 
+    Built once per module; ``_reset_mock_ollama_client`` clears call records between tests.
+    """
+    return _FakeOllamaClient(mock_ollama_response)
 
-class TestingAgentChaining:
-    """Test chaining agents together with realistic scenarios."""
 
-    @patch("local_agents.base.OllamaClient")
-    def test_plan_to_code_integration(self, mock_ollama_class, mock_ollama_client_with_responses):
-        """Test integrating planning and coding agents."""
-        mock_ollama_class.return_value = mock_ollama_client_with_responses
+@pytest.fixture(scope="module", autouse=True)
+def mock_ollama_class(mock_ollama_client_with_responses):
+    """Patch OllamaClient once for the module so agents built without a client get the fake."""
+    from local_agents import base as agent_base
 
-        # Create agents
-        planner = PlanningAgent()
-        coder = CodingAgent()
+    with patch.object(agent_base, "OllamaClient") as mock_class:
+        mock_class.return_value = mock_ollama_client_with_responses
+        yield mock_class
 
-        # Execute planning
-        plan_result = planner.execute(
-            "Create a simple calculator function",
-            {"language": "python", "style": "functional"},
-        )
 
-        assert plan_result.success
-        assert "Implementation Plan" in plan_result.output
-        assert "calculator function" in plan_result.output.lower()
+@pytest.fixture(autouse=True)
+def _reset_mock_ollama_client(mock_ollama_class, mock_ollama_client_with_responses):
+    """Clear calls recorded on the shared mocks by earlier tests."""
+    mock_ollama_class.reset_mock()
+    mock_ollama_class.return_value = mock_ollama_client_with_responses
+    mock_ollama_client_with_responses.reset_mock()
 
-        # Use planning output for coding
-        code_context = {
-            "implementation_plan": plan_result.output,
-            "language": "python",
-            "target_file": "calculator.py",
-        }
 
-        code_result = coder.execute("Implement the calculator based on the plan", code_context)
+@pytest.fixture(scope="class")
+def planner(mock_ollama_client_with_responses):
+    """Create a planning agent shared by the chaining tests."""
+    from local_agents.agents.planner import PlanningAgent
 
-        assert code_result.success
-        assert "def calculator" in code_result.output
-        assert "operation: str" in code_result.output
-        assert "float" in code_result.output
+    return PlanningAgent(ollama_client=mock_ollama_client_with_responses)
 
-    @patch("local_agents.base.OllamaClient")
-    def test_code_to_test_integration(self, mock_ollama_class, mock_ollama_client_with_responses):
-        """Test integrating coding and testing agents."""
-        mock_ollama_class.return_value = mock_ollama_client_with_responses
 
-        # Create agents
-        coder = CodingAgent()
-        tester = TestingAgent()
+@pytest.fixture(scope="class")
+def coder(mock_ollama_client_with_responses):
+    """Create a coding agent shared by the chaining tests."""
+    from local_agents.agents.coder import CodingAgent
 
-        # Generate code first
-        code_result = coder.execute("Create a calculator function", {"language": "python"})
+    return CodingAgent(ollama_client=mock_ollama_client_with_responses)
 
-        assert code_result.success
 
-        # Generate tests for the code
-        test_context = {
-            "code_to_test": code_result.output,
-            "framework": "pytest",
-            "target_file": "calculator.py",
-        }
+@pytest.fixture(scope="class")
+def tester(mock_ollama_client_with_responses):
+    """Create a testing agent shared by the chaining tests."""
+    from local_agents.agents.tester import TestingAgent
 
-        test_result = tester.execute(
-            "Generate comprehensive tests for the calculator function",
-            test_context,
-        )
+    return TestingAgent(ollama_client=mock_ollama_client_with_responses)
 
-        assert test_result.success
-        assert "def test_" in test_result.output
-        assert "pytest" in test_result.output.lower()
-        assert "calculator" in test_result.output
 
-    @patch("local_agents.base.OllamaClient")
-    def test_code_to_review_integration(self, mock_ollama_class, mock_ollama_client_with_responses):
-        """Test integrating coding and review agents."""
-        mock_ollama_class.return_value = mock_ollama_client_with_responses
+@pytest.fixture(scope="class")
+def reviewer(mock_ollama_client_with_responses):
+    """Create a review agent shared by the chaining tests."""
+    from local_agents.agents.reviewer import ReviewAgent
 
-        # Create agents
-        coder = CodingAgent()
-        reviewer = ReviewAgent()
+    return ReviewAgent(ollama_client=mock_ollama_client_with_responses)
 
-        # Generate code first
-        code_result = coder.execute("Create a calculator function", {"language": "python"})
 
-        assert code_result.success
+@pytest.fixture(scope="class")
+def plan_result(planner):
+    """Plan the calculator once for the chaining tests."""
+    return planner.execute("Create a simple calculator function", _PY_FUNC_CTX)
 
-        # Review the generated code
-        review_context = {
-            "code_content": code_result.output,
-            "focus_area": "security",
-            "target_file": "calculator.py",
-        }
 
-        review_result = reviewer.execute("Review the calculator implementation", review_context)
+@pytest.fixture(scope="class")
+def code_result(coder, plan_result):
+    """Implement the planned calculator once for the downstream agents."""
+    code_context = {
+        **_PY_CTX,
+        "implementation_plan": plan_result.output,
+        "target_file": "calculator.py",
+    }
+    return coder.execute("Implement the calculator based on the plan", code_context)
 
-        assert review_result.success
-        assert "Code Review" in review_result.output
-        assert "Summary" in review_result.output
-        assert any(
-            word in review_result.output.lower()
-            for word in ["positive", "issues", "recommendations"]
-        )
 
-    @patch("local_agents.base.OllamaClient")
-    def test_full_agent_chain(self, mock_ollama_class, mock_ollama_client_with_responses):
-        """Test full chain: Plan -> Code -> Test -> Review."""
-        mock_ollama_class.return_value = mock_ollama_client_with_responses
+class TestingAgentChaining:
+    """Test chaining agents together with realistic scenarios."""
 
-        # Create all agents
-        planner = PlanningAgent()
-        coder = CodingAgent()
-        tester = TestingAgent()
-        reviewer = ReviewAgent()
+    def test_plan_to_code_integration(self, plan_result, code_result):
+        """Test integrating planning and coding agents."""
+        assert plan_result.success
+        assert "Implementation Plan" in plan_result.output
+        assert "calculator function" in plan_result.output.lower()
 
+        assert code_result.success
+        assert "def calculator" in code_result.output
+        assert "operation: str" in code_result.output
+        assert "float" in code_result.output
+
+    @pytest.mark.parametrize(
+        "agent_name, code_key, task, context, expected",
+        [
+            pytest.param(
+                "tester",
+                "code_to_test",
+                "Generate comprehensive tests for the calculator function",
+                {"framework": "pytest", "target_file": "calculator.py"},
+                ["def test_", "pytest", "calculator"],
+                id="code_to_test",
+            ),
+            pytest.param(
+                "reviewer",
+                "code_content",
+                "Review the calculator implementation",
+                {"focus_area": "security", "target_file": "calculator.py"},
+                ["Code Review", "Summary", "Recommendations"],
+                id="code_to_review",
+            ),
+        ],
+    )
+    def test_code_to_downstream_integration(
+        self, request, code_result, agent_name, code_key, task, context, expected
+    ):
+        """Test feeding generated code into the testing and review agents."""
+        agent = request.getfixturevalue(agent_name)
+
+        result = agent.execute(task, {**context, code_key: code_result.output})
+
+        assert result.success
+        for substring in expected:
+            assert substring in result.output
+
+    def test_full_agent_chain(self, planner, coder, tester, reviewer):
+        """Test full chain: Plan -> Code -> Test -> Review."""
         task = "Create a robust calculator function"
-        context = {
-            "language": "python",
-            "requirements": "basic arithmetic operations",
-        }
+        context = _CHAIN_CTX
 
         # Step 1: Planning
         plan_result = planner.execute(task, context)
         assert plan_result.success
 
         # Step 2: Coding (using plan output)
-        code_context = context.copy()
-        code_context["implementation_plan"] = plan_result.output
+        code_context = {**context, "implementation_plan": plan_result.output}
 
         code_result = coder.execute("Implement calculator based on the plan", code_context)
         assert code_result.success
 
-        # Step 3: Testing (using code output)
-        test_context = context.copy()
-        test_context["code_to_test"] = code_result.output
-        test_context["framework"] = "pytest"
+        # Steps 3 and 4: Testing and Review only depend on the code output, so run them together
+        test_context = {**context, "code_to_test": code_result.output, "framework": "pytest"}
+        review_context = {**context, "code_content": code_result.output, "focus_area": "all"}
 
-        test_result = tester.execute("Generate tests for the calculator", test_context)
-        assert test_result.success
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            test_future = executor.submit(
+                tester.execute, "Generate tests for the calculator", test_context
+            )
+            review_future = executor.submit(
+                reviewer.execute, "Review the complete implementation", review_context
+            )
+            test_result = test_future.result()
+            review_result = review_future.result()
 
-        # Step 4: Review (using code output)
-        review_context = context.copy()
-        review_context["code_content"] = code_result.output
-        review_context["focus_area"] = "all"
-
-        review_result = reviewer.execute("Review the complete implementation", review_context)
+        assert test_result.success
         assert review_result.success
 
         # Verify all results contain expected content
@@ -322,28 +382,30 @@ class TestingAgentChaining:
 class TestingAgentErrorHandling:
     """Test error handling in agent integration scenarios."""
 
-    @patch("local_agents.base.OllamaClient")
     def test_agent_handles_ollama_failure(self, mock_ollama_class):
         """Test agent handles Ollama client failures gracefully."""
+        from local_agents.agents.planner import PlanningAgent
+
         # Create mock that raises exception
-        mock_client = Mock(spec=OllamaClient)
-        mock_client.is_model_available.return_value = True
-        mock_client.pull_model.return_value = True
-        mock_client.generate.side_effect = Exception("Connection failed")
+        def failing_generate(model, prompt, **kwargs):
+            raise Exception("Connection failed")
+
+        mock_client = _FakeOllamaClient(failing_generate)
         mock_ollama_class.return_value = mock_client
 
         planner = PlanningAgent()
 
-        result = planner.execute("Create a plan", {"language": "python"})
+        result = planner.execute("Create a plan", _PY_CTX)
 
         assert not result.success
         assert "Connection failed" in result.error
         assert result.agent_type == "plan"
 
-    @patch("local_agents.base.OllamaClient")
     def test_agent_handles_model_unavailable(self, mock_ollama_class):
         """Test agent handles unavailable model."""
-        mock_client = Mock(spec=OllamaClient)
+        from local_agents.agents.planner import PlanningAgent
+
+        mock_client = _FakeOllamaClient(_route_response)
         mock_client.is_model_available.return_value = False
         mock_client.pull_model.return_value = False
         mock_ollama_class.return_value = mock_client
@@ -355,12 +417,9 @@ class TestingAgentErrorHandling:
 class TestingAgentContextHandling:
     """Test how agents handle different context scenarios."""
 
-    @patch("local_agents.base.OllamaClient")
-    def test_agent_handles_empty_context(
-        self, mock_ollama_class, mock_ollama_client_with_responses
-    ):
+    def test_agent_handles_empty_context(self):
         """Test agent handles empty or None context."""
-        mock_ollama_class.return_value = mock_ollama_client_with_responses
+        from local_agents.agents.planner import PlanningAgent
 
         planner = PlanningAgent()
 
@@ -372,21 +431,19 @@ class TestingAgentContextHandling:
         result2 = planner.execute("Create a plan", {})
         assert result2.success
 
-    @patch("local_agents.base.OllamaClient")
     def test_agent_handles_rich_context(
         self,
-        mock_ollama_class,
-        mock_ollama_client_with_responses,
         sample_python_file,
+        sample_python_text,
     ):
         """Test agent handles context with file content."""
-        mock_ollama_class.return_value = mock_ollama_client_with_responses
+        from local_agents.agents.reviewer import ReviewAgent
 
         reviewer = ReviewAgent()
 
         context = {
             "target_file": str(sample_python_file),
-            "code_content": sample_python_file.read_text(),
+            "code_content": sample_python_text,
             "focus_area": "performance",
             "project_type": "library",
         }
@@ -398,10 +455,9 @@ class TestingAgentContextHandling:
         # Verify the agent received and can work with rich context
         assert result.context == context
 
-    @patch("local_agents.base.OllamaClient")
-    def test_agent_context_propagation(self, mock_ollama_class, mock_ollama_client_with_responses):
+    def test_agent_context_propagation(self):
         """Test that context is properly propagated through agent execution."""
-        mock_ollama_class.return_value = mock_ollama_client_with_responses
+        from local_agents.agents.coder import CodingAgent
 
         coder = CodingAgent()
 
@@ -423,10 +479,9 @@ class TestingAgentContextHandling:
 class TestingAgentStreamingSupport:
     """Test streaming functionality across agents."""
 
-    @patch("local_agents.base.OllamaClient")
-    def test_agent_streaming_mode(self, mock_ollama_class, mock_ollama_client_with_responses):
+    def test_agent_streaming_mode(self, mock_ollama_client_with_responses):
         """Test that agents properly support streaming mode."""
-        mock_ollama_class.return_value = mock_ollama_client_with_responses
+        from local_agents.agents.planner import PlanningAgent
 
         planner = PlanningAgent()
 
@@ -438,15 +493,16 @@ class TestingAgentStreamingSupport:
         )
 
         assert result.success
+        # Streamed output still arrives as the assembled text
+        assert isinstance(result.output, str)
         # Verify streaming parameter was passed to Ollama client
-        mock_ollama_client_with_responses.generate.assert_called()
-        call_args = mock_ollama_client_with_responses.generate.call_args
-        assert call_args[1]["stream"] is True
+        calls = mock_ollama_client_with_responses.generate.calls
+        assert calls
+        assert calls[-1][1]["stream"] is True
 
-    @patch("local_agents.base.OllamaClient")
-    def test_agent_non_streaming_mode(self, mock_ollama_class, mock_ollama_client_with_responses):
+    def test_agent_non_streaming_mode(self, mock_ollama_client_with_responses):
         """Test that agents work in non-streaming mode."""
-        mock_ollama_class.return_value = mock_ollama_client_with_responses
+        from local_agents.agents.planner import PlanningAgent
 
         planner = PlanningAgent()
 
@@ -455,5 +511,5 @@ class TestingAgentStreamingSupport:
 
         assert result.success
         # Verify streaming parameter was passed as False
-        call_args = mock_ollama_client_with_responses.generate.call_args
-        assert call_args[1]["stream"] is False
+        calls = mock_ollama_client_with_responses.generate.calls
+        assert calls[-1][1]["stream"] is False
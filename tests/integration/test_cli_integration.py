@@ -3,48 +3,141 @@
 from unittest.mock import Mock, patch
 
 import pytest
+from click.exceptions import Exit
 from click.testing import CliRunner
+from rich.console import Console
 
 from local_agents.base import TaskResult
 from local_agents.cli import code, main, plan, review, test, workflow
 from local_agents.workflows.orchestrator import WorkflowResult
 
-
-@pytest.fixture
+_SUCCESS_RESULT = TaskResult(
+    success=True,
+    output="Mock successful output",
+    agent_type="mock",
+    task="Mock task",
+)
+
+_FAILURE_RESULT = TaskResult(
+    success=False,
+    output="",
+    agent_type="mock",
+    task="Mock task",
+    error="Mock error occurred",
+)
+
+_WORKFLOW_TASK_RESULT = TaskResult(
+    success=True,
+    output="Mock output",
+    agent_type="plan",
+    task="Create calculator",
+)
+
+_WORKFLOW_RESULT = WorkflowResult(
+    success=True,
+    results=[_WORKFLOW_TASK_RESULT],
+    workflow_name="feature-dev",
+    task="Create calculator",
+    total_steps=1,
+    completed_steps=1,
+    execution_time=1.0,
+)
+
+
+_QUIET_CONSOLE = Console(quiet=True)
+
+
+def run_callback(command, *args):
+    """Run a command's callback directly, bypassing CliRunner.
+
+    Arguments are still parsed by Click so option defaults apply, but there is no
+    stream capture and Rich rendering goes to a quiet console. Use ``CliRunner``
+    for tests that assert on the command's output.
+    """
+    ctx = command.make_context(command.name, list(args))
+    with ctx, patch("local_agents.cli.console", _QUIET_CONSOLE):
+        try:
+            return ctx.invoke(command.callback, **ctx.params)
+        except Exit:
+            return None
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _plain_console():
+    """Render CLI output without colour, highlighting or terminal width probing.
+
+    Tests only search ``result.output`` for substrings, so Rich's styling work is
+    wasted. The consoles still write to ``sys.stdout``, which CliRunner captures.
+    """
+    plain = Console(color_system=None, highlight=False, width=80)
+    with patch("local_agents.cli.console", plain), patch("local_agents.base.console", plain):
+        yield
+
+
+@pytest.fixture(scope="session")
 def cli_runner():
-    """Create a Click CLI runner for testing."""
+    """Create a Click CLI runner, shared across the session."""
     return CliRunner()
 
 
+class FakeAgent:
+    """Lightweight agent stand-in that records ``execute`` calls.
+
+    Each call is stored in ``calls`` as ``(task, context, kwargs)``.
+    """
+
+    __slots__ = ("agent_type", "_result", "calls", "info_displays")
+
+    def __init__(self, result):
+        self.agent_type = "mock"
+        self._result = result
+        self.calls = []
+        self.info_displays = 0
+
+    def execute(self, task, context=None, **kwargs):
+        self.calls.append((task, context, kwargs))
+        return self._result
+
+    def display_info(self):
+        self.info_displays += 1
+
+
+@pytest.fixture(scope="session")
+def agent_factory():
+    """Provide a factory for fresh fake agents, e.g. ``agent_factory(success=False)``."""
+
+    def make_agent(success=True):
+        return FakeAgent(_SUCCESS_RESULT if success else _FAILURE_RESULT)
+
+    return make_agent
+
+
 @pytest.fixture
-def mock_successful_agent():
-    """Mock agent that returns successful results."""
-    mock_agent = Mock()
-    mock_agent.agent_type = "mock"
-    mock_agent.execute.return_value = TaskResult(
-        success=True,
-        output="Mock successful output",
-        agent_type="mock",
-        task="Mock task",
-    )
-    mock_agent.display_info.return_value = None
-    return mock_agent
+def mock_successful_agent(agent_factory):
+    """Fake agent that returns successful results."""
+    return agent_factory()
+
+
+_AGENT_CLASSES = ("PlanningAgent", "CodingAgent", "TestingAgent", "ReviewAgent")
 
 
 @pytest.fixture
-def mock_failed_agent():
-    """Mock agent that returns failed results."""
-    mock_agent = Mock()
-    mock_agent.agent_type = "mock"
-    mock_agent.execute.return_value = TaskResult(
-        success=False,
-        output="",
-        agent_type="mock",
-        task="Mock task",
-        error="Mock error occurred",
-    )
-    mock_agent.display_info.return_value = None
-    return mock_agent
+def patched_agents(monkeypatch, mock_successful_agent):
+    """Make every CLI agent class build the test's successful fake agent.
+
+    Returns the fake agent, so tests can assert on its recorded ``calls``.
+    """
+    for name in _AGENT_CLASSES:
+        monkeypatch.setattr(
+            f"local_agents.cli.{name}", lambda *args, **kwargs: mock_successful_agent
+        )
+    return mock_successful_agent
+
+
+@pytest.fixture
+def mock_failed_agent(agent_factory):
+    """Fake agent that returns failed results."""
+    return agent_factory(success=False)
 
 
 class TestCLIBasicCommands:
@@ -77,76 +170,36 @@ class TestCLIBasicCommands:
         assert "Local Agents" in result.output
         assert "Welcome" in result.output or "Available Commands" in result.output
 
-    @patch("local_agents.cli.PlanningAgent")
-    def test_plan_command_success(self, mock_agent_class, cli_runner, mock_successful_agent):
-        """Test successful plan command execution."""
-        mock_agent_class.return_value = mock_successful_agent
-
-        result = cli_runner.invoke(plan, ["Create a calculator app"])
-
-        assert result.exit_code == 0
-        mock_agent_class.assert_called_once()
-        mock_successful_agent.execute.assert_called_once()
-        mock_successful_agent.display_info.assert_called_once()
-
-    @patch("local_agents.cli.CodingAgent")
-    def test_code_command_success(self, mock_agent_class, cli_runner, mock_successful_agent):
-        """Test successful code command execution."""
-        mock_agent_class.return_value = mock_successful_agent
-
-        result = cli_runner.invoke(code, ["Implement calculator function"])
-
-        assert result.exit_code == 0
-        mock_agent_class.assert_called_once()
-        mock_successful_agent.execute.assert_called_once()
-
-    @patch("local_agents.cli.TestingAgent")
-    def test_test_command_success(self, mock_agent_class, cli_runner, mock_successful_agent):
-        """Test successful test command execution."""
-        mock_agent_class.return_value = mock_successful_agent
-
-        result = cli_runner.invoke(test, ["calculator.py"])
+    @pytest.mark.parametrize(
+        "command,args",
+        [
+            (plan, ["Create a calculator app"]),
+            (code, ["Implement calculator function"]),
+            (test, ["calculator.py"]),
+            (review, ["{tmpfile}"]),
+        ],
+        ids=["plan", "code", "test", "review"],
+    )
+    def test_command_success(self, command, args, patched_agents, tmp_path):
+        """Test successful execution of each agent command."""
+        if "{tmpfile}" in args:
+            # Review needs an existing file to read
+            test_file = tmp_path / "test.py"
+            test_file.write_text("def hello(): pass")
+            args = [str(test_file) if arg == "{tmpfile}" else arg for arg in args]
 
-        assert result.exit_code == 0
-        mock_agent_class.assert_called_once()
-        mock_successful_agent.execute.assert_called_once()
-
-    @patch("local_agents.cli.ReviewAgent")
-    def test_review_command_success(
-        self,
-        mock_agent_class,
-        cli_runner,
-        mock_successful_agent,
-        temp_directory,
-    ):
-        """Test successful review command execution."""
-        mock_agent_class.return_value = mock_successful_agent
-
-        # Create a temporary file to review
-        test_file = temp_directory / "test.py"
-        test_file.write_text("def hello(): pass")
-
-        result = cli_runner.invoke(review, [str(test_file)])
+        run_callback(command, *args)
 
-        assert result.exit_code == 0
-        mock_agent_class.assert_called_once()
-        mock_successful_agent.execute.assert_called_once()
+        assert len(patched_agents.calls) == 1
+        assert patched_agents.info_displays == 1
 
 
 class TestCLICommandOptions:
     """Test CLI command options and parameters."""
 
-    @patch("local_agents.cli.PlanningAgent")
-    def test_plan_with_output_file(
-        self,
-        mock_agent_class,
-        cli_runner,
-        mock_successful_agent,
-        temp_directory,
-    ):
+    def test_plan_with_output_file(self, cli_runner, patched_agents, tmp_path):
         """Test plan command with output file option."""
-        mock_agent_class.return_value = mock_successful_agent
-        output_file = temp_directory / "plan.md"
+        output_file = tmp_path / "plan.md"
 
         result = cli_runner.invoke(plan, ["Create a web app", "--output", str(output_file)])
 
@@ -154,130 +207,111 @@ class TestCLICommandOptions:
         assert output_file.exists()
         assert output_file.read_text() == "Mock successful output"
 
-    @patch("local_agents.cli.PlanningAgent")
-    def test_plan_with_context_file(
-        self,
-        mock_agent_class,
-        cli_runner,
-        mock_successful_agent,
-        sample_python_file,
-    ):
+    def test_plan_with_context_file(self, cli_runner, patched_agents, sample_python_file):
         """Test plan command with context file."""
-        mock_agent_class.return_value = mock_successful_agent
-
         result = cli_runner.invoke(
             plan, ["Improve this code", "--context", str(sample_python_file)]
         )
 
         assert result.exit_code == 0
         # Verify context was passed to agent
-        call_args = mock_successful_agent.execute.call_args
-        context = call_args[0][1]  # Second argument is context
+        _, context, _ = patched_agents.calls[-1]
         assert "file_content" in context
 
-    @patch("local_agents.cli.CodingAgent")
-    def test_code_with_file_option(self, mock_agent_class, cli_runner, mock_successful_agent):
+    def test_code_with_file_option(self, cli_runner, patched_agents):
         """Test code command with file option."""
-        mock_agent_class.return_value = mock_successful_agent
-
         result = cli_runner.invoke(code, ["Add error handling", "--file", "calculator.py"])
 
         assert result.exit_code == 0
         # Verify file context was passed
-        call_args = mock_successful_agent.execute.call_args
-        context = call_args[0][1]
+        _, context, _ = patched_agents.calls[-1]
         assert "target_file" in context
         assert context["target_file"] == "calculator.py"
 
-    @patch("local_agents.cli.TestingAgent")
-    def test_test_with_framework_option(self, mock_agent_class, cli_runner, mock_successful_agent):
+    def test_test_with_framework_option(self, cli_runner, patched_agents):
         """Test test command with framework option."""
-        mock_agent_class.return_value = mock_successful_agent
-
         result = cli_runner.invoke(test, ["calculator.py", "--framework", "pytest"])
 
         assert result.exit_code == 0
         # Verify framework was passed in context
-        call_args = mock_successful_agent.execute.call_args
-        context = call_args[0][1]
+        _, context, _ = patched_agents.calls[-1]
         assert "framework" in context
         assert context["framework"] == "pytest"
 
-    @patch("local_agents.cli.ReviewAgent")
-    def test_review_with_focus_option(
-        self,
-        mock_agent_class,
-        cli_runner,
-        mock_successful_agent,
-        sample_python_file,
-    ):
+    def test_review_with_focus_option(self, cli_runner, patched_agents, sample_python_file):
         """Test review command with focus option."""
-        mock_agent_class.return_value = mock_successful_agent
-
         result = cli_runner.invoke(review, [str(sample_python_file), "--focus", "security"])
 
         assert result.exit_code == 0
         # Verify focus area was passed in context
-        call_args = mock_successful_agent.execute.call_args
-        context = call_args[0][1]
+        _, context, _ = patched_agents.calls[-1]
         assert "focus_area" in context
         assert context["focus_area"] == "security"
 
-    @patch("local_agents.cli.PlanningAgent")
-    def test_streaming_option(self, mock_agent_class, cli_runner, mock_successful_agent):
+    def test_streaming_option(self, cli_runner, patched_agents):
         """Test streaming option is passed to agents."""
-        mock_agent_class.return_value = mock_successful_agent
-
         result = cli_runner.invoke(plan, ["Create app", "--stream"])
 
         assert result.exit_code == 0
         # Verify streaming was passed to agent
-        call_args = mock_successful_agent.execute.call_args
-        assert call_args[1]["stream"] is True  # stream is keyword arg
+        _, _, kwargs = patched_agents.calls[-1]
+        assert kwargs["stream"] is True  # stream is keyword arg
+
+
+@pytest.fixture
+def error_panels(monkeypatch):
+    """Record ``(heading, message, title)`` for each error panel the CLI shows."""
+    panels = []
+    monkeypatch.setattr(
+        "local_agents.cli.display_error_panel",
+        lambda heading, message, title: panels.append((heading, message, title)),
+    )
+    return panels
 
 
 class TestCLIErrorHandling:
     """Test CLI error handling scenarios."""
 
     @patch("local_agents.cli.PlanningAgent")
-    def test_agent_failure_handling(self, mock_agent_class, cli_runner, mock_failed_agent):
+    def test_agent_failure_handling(self, mock_agent_class, mock_failed_agent):
         """Test CLI handles agent failures gracefully."""
         mock_agent_class.return_value = mock_failed_agent
 
-        result = cli_runner.invoke(plan, ["Create a plan"])
+        # CLI should not crash; the failed result is displayed, not raised
+        run_callback(plan, "Create a plan")
 
-        # CLI should not crash but should show error
-        assert result.exit_code == 0  # CLI itself doesn't exit with error
-        # Error should be displayed through agent's error handling
-        mock_failed_agent.execute.assert_called_once()
+        assert len(mock_failed_agent.calls) == 1
 
-    @patch("local_agents.cli.PlanningAgent")
-    def test_connection_error_handling(self, mock_agent_class, cli_runner):
-        """Test CLI handles connection errors gracefully."""
-        # Mock agent that raises ConnectionError
+    @pytest.mark.parametrize(
+        "error,heading,title",
+        [
+            (ConnectionError("Cannot connect to Ollama"), "Connection Error", "Connection Failed"),
+            (TimeoutError("Request timed out"), "Request Timeout", "Timeout Error"),
+        ],
+        ids=["connection", "timeout"],
+    )
+    def test_agent_error_panels(self, error, heading, title, error_panels):
+        """Test CLI shows the matching error panel when the agent raises."""
         mock_agent = Mock()
         mock_agent.display_info.return_value = None
-        mock_agent.execute.side_effect = ConnectionError("Cannot connect to Ollama")
-        mock_agent_class.return_value = mock_agent
+        mock_agent.execute.side_effect = error
 
-        result = cli_runner.invoke(plan, ["Test connection error"])
+        with patch("local_agents.cli.PlanningAgent", return_value=mock_agent):
+            run_callback(plan, "Test agent error")
 
-        assert result.exit_code == 0
-        # Should display connection error panel
-        assert "Connection Error" in result.output or "Connection Failed" in result.output
+        assert [(h, t) for h, _, t in error_panels] == [(heading, title)]
 
-    @patch("local_agents.cli.PlanningAgent")
-    def test_timeout_error_handling(self, mock_agent_class, cli_runner):
-        """Test CLI handles timeout errors gracefully."""
+    def test_connection_error_panel_output(self, cli_runner):
+        """Test the connection error panel is rendered in the command output."""
         mock_agent = Mock()
         mock_agent.display_info.return_value = None
-        mock_agent.execute.side_effect = TimeoutError("Request timed out")
-        mock_agent_class.return_value = mock_agent
+        mock_agent.execute.side_effect = ConnectionError("Cannot connect to Ollama")
 
-        result = cli_runner.invoke(plan, ["Test timeout"])
+        with patch("local_agents.cli.PlanningAgent", return_value=mock_agent):
+            result = cli_runner.invoke(plan, ["Test connection error"])
 
-        assert result.exit_code == 0
-        assert "Timeout" in result.output or "timed out" in result.output
+        assert "Connection Failed" in result.output
+        assert "Connection Error" in result.output
 
     def test_review_nonexistent_file(self, cli_runner):
         """Test review command with nonexistent file."""
@@ -294,26 +328,7 @@ class TestWorkflowCLI:
     def test_workflow_command_success(self, mock_workflow_class, cli_runner):
         """Test successful workflow command execution."""
         mock_workflow = Mock()
-
-        # Create a proper WorkflowResult object
-        mock_task_result = TaskResult(
-            success=True,
-            output="Mock output",
-            agent_type="plan",
-            task="Create calculator",
-        )
-
-        mock_workflow_result = WorkflowResult(
-            success=True,
-            results=[mock_task_result],
-            workflow_name="feature-dev",
-            task="Create calculator",
-            total_steps=1,
-            completed_steps=1,
-            execution_time=1.0,
-        )
-
-        mock_workflow.execute_workflow.return_value = mock_workflow_result
+        mock_workflow.execute_workflow.return_value = _WORKFLOW_RESULT
         mock_workflow_class.return_value = mock_workflow
 
         result = cli_runner.invoke(workflow, ["feature-dev", "Create calculator"])
@@ -355,7 +370,7 @@ class TestWorkflowCLI:
         assert "file_content" in context
 
     @patch("local_agents.cli.Workflow")
-    def test_workflow_with_output_dir(self, mock_workflow_class, cli_runner, temp_directory):
+    def test_workflow_with_output_dir(self, mock_workflow_class, cli_runner, tmp_path):
         """Test workflow command with output directory."""
         mock_workflow = Mock()
         mock_workflow.execute_workflow.return_value = {
@@ -365,7 +380,7 @@ class TestWorkflowCLI:
         }
         mock_workflow_class.return_value = mock_workflow
 
-        output_dir = temp_directory / "workflow_output"
+        output_dir = tmp_path / "workflow_output"
 
         result = cli_runner.invoke(
             workflow,
@@ -458,17 +473,9 @@ class TestConfigCLI:
 class TestCLIInputOutput:
     """Test CLI input/output handling."""
 
-    @patch("local_agents.cli.PlanningAgent")
-    def test_output_file_creation(
-        self,
-        mock_agent_class,
-        cli_runner,
-        mock_successful_agent,
-        temp_directory,
-    ):
+    def test_output_file_creation(self, cli_runner, patched_agents, tmp_path):
         """Test that output files are created correctly."""
-        mock_agent_class.return_value = mock_successful_agent
-        output_file = temp_directory / "subdir" / "output.txt"
+        output_file = tmp_path / "subdir" / "output.txt"
 
         result = cli_runner.invoke(plan, ["Create plan", "--output", str(output_file)])
 
@@ -477,17 +484,8 @@ class TestCLIInputOutput:
         assert output_file.parent.exists()  # Directory should be created
         assert output_file.read_text() == "Mock successful output"
 
-    @patch("local_agents.cli.PlanningAgent")
-    def test_context_directory_handling(
-        self,
-        mock_agent_class,
-        cli_runner,
-        mock_successful_agent,
-        sample_project_directory,
-    ):
+    def test_context_directory_handling(self, cli_runner, patched_agents, sample_project_directory):
         """Test context directory handling."""
-        mock_agent_class.return_value = mock_successful_agent
-
         result = cli_runner.invoke(
             plan,
             [
@@ -499,7 +497,6 @@ class TestCLIInputOutput:
 
         assert result.exit_code == 0
         # Verify directory context was passed
-        call_args = mock_successful_agent.execute.call_args
-        context = call_args[0][1]
+        _, context, _ = patched_agents.calls[-1]
         assert "directory" in context
         assert context["directory"] == str(sample_project_directory)
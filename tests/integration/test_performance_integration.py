@@ -2,29 +2,15 @@
 
 from unittest.mock import Mock, patch
 
-from local_agents.agents import CodingAgent, PlanningAgent, ReviewAgent, TestingAgent
-from local_agents.benchmarks import benchmark_system
-from local_agents.config import config_manager
-from local_agents.hardware import hardware_optimizer
-from local_agents.ollama_client import OllamaClient
-from local_agents.performance import performance_monitor
+import pytest
 
 
 class TestPerformanceIntegration:
     """Test Phase 2 performance feature integration."""
 
-    def test_performance_module_imports(self):
-        """Test that all Phase 2 performance modules can be imported and accessed."""
-        # Test that objects are accessible
-        assert performance_monitor is not None
-        assert hardware_optimizer is not None
-        assert benchmark_system is not None
-        assert OllamaClient is not None
-        assert config_manager is not None
-
-    def test_configuration_with_performance_settings(self):
+    def test_configuration_with_performance_settings(self, loaded_config):
         """Test configuration system includes performance settings."""
-        config = config_manager.load_config()
+        config = loaded_config
 
         # Test performance configuration exists
         assert hasattr(config, "performance")
@@ -41,10 +27,10 @@ class TestPerformanceIntegration:
         assert config.performance.cache_size >= 0
         assert config.performance.cache_ttl_seconds >= 0
 
-    def test_hardware_detection_system(self):
+    @pytest.mark.hardware
+    def test_hardware_detection_system(self, hw_info, hw_profile):
         """Test hardware detection and profiling functionality."""
-        hw_info = hardware_optimizer.detected_hardware
-        profile = hardware_optimizer.detect_best_profile()
+        profile = hw_profile
 
         # Test hardware info structure
         assert "platform" in hw_info
@@ -67,6 +53,8 @@ class TestPerformanceIntegration:
 
     def test_performance_monitoring_lifecycle(self):
         """Test performance monitoring system lifecycle."""
+        from local_agents.performance import performance_monitor
+
         # Test monitoring can be started and stopped
         performance_monitor.start_monitoring()
         assert performance_monitor.monitoring_active is True
@@ -81,6 +69,8 @@ class TestPerformanceIntegration:
 
     def test_caching_system_functionality(self):
         """Test OllamaClient caching system."""
+        from local_agents.ollama_client import OllamaClient
+
         # Test client creation with caching
         client = OllamaClient(enable_cache=True)
         assert client.enable_cache is True
@@ -99,6 +89,8 @@ class TestPerformanceIntegration:
 
     def test_benchmark_system_configuration(self):
         """Test benchmark system is properly configured."""
+        from local_agents.benchmarks import benchmark_system
+
         targets = benchmark_system.performance_targets
 
         # Test performance targets are defined
@@ -117,6 +109,8 @@ class TestPerformanceIntegration:
     @patch("local_agents.base.OllamaClient")
     def test_agent_creation_with_performance_features(self, mock_ollama_class):
         """Test that agents can be created with performance enhancements active."""
+        from local_agents.agents import CodingAgent, PlanningAgent, ReviewAgent, TestingAgent
+
         # Set up mock OllamaClient
         mock_client = Mock()
         mock_client.is_model_available.return_value = True
@@ -142,14 +136,13 @@ class TestPerformanceIntegration:
         assert hasattr(tester, "ollama_client")
         assert hasattr(reviewer, "ollama_client")
 
-    def test_hardware_optimization_integration(self):
+    @pytest.mark.hardware
+    def test_hardware_optimization_integration(self, hw_profile):
         """Test hardware optimization can be applied to configuration."""
-        # Get current config
-        original_config = config_manager.load_config()
+        from local_agents.hardware import hardware_optimizer
 
         # Test optimization config generation
-        profile = hardware_optimizer.detect_best_profile()
-        optimization_config = hardware_optimizer.get_optimization_config(profile)
+        optimization_config = hardware_optimizer.get_optimization_config(hw_profile)
 
         assert isinstance(optimization_config, dict)
         assert "profile_name" in optimization_config
@@ -157,10 +150,12 @@ class TestPerformanceIntegration:
         assert "performance_settings" in optimization_config
         assert "detected_hardware" in optimization_config
 
-    def test_performance_features_backward_compatibility(self):
+    def test_performance_features_backward_compatibility(self, loaded_config):
         """Test that performance features don't break existing functionality."""
+        from local_agents.config import config_manager
+
         # Test that config manager still works normally
-        config = config_manager.load_config()
+        config = loaded_config
         assert hasattr(config, "default_model")
         assert hasattr(config, "agents")
         assert hasattr(config, "workflows")
@@ -175,8 +170,11 @@ class TestPerformanceIntegration:
         workflow_steps = config_manager.get_workflow_steps("feature-dev")
         assert isinstance(workflow_steps, list)
 
+    @pytest.mark.hardware
     def test_connection_pooling_functionality(self):
         """Test that OllamaClient connection pooling works."""
+        from local_agents.ollama_client import OllamaClient
+
         host1 = "http://localhost:11434"
         host2 = "http://localhost:11435"  # Different host for testing
 
@@ -201,6 +199,8 @@ class TestPerformanceBenchmarkIntegration:
 
     def test_benchmark_suite_structure(self):
         """Test that benchmark suites are properly structured."""
+        from local_agents.benchmarks import benchmark_system
+
         # Test benchmark task definitions exist
         assert hasattr(benchmark_system, "benchmark_tasks")
         assert isinstance(benchmark_system.benchmark_tasks, dict)
@@ -223,12 +223,12 @@ class TestPerformanceBenchmarkIntegration:
 
     def test_performance_target_validation(self):
         """Test performance target validation functionality."""
+        from local_agents.benchmarks import BenchmarkResult, BenchmarkSuite, benchmark_system
+
         # Test validation function exists
         assert hasattr(benchmark_system, "validate_performance_targets")
 
         # Test with mock benchmark result
-        from local_agents.benchmarks import BenchmarkResult, BenchmarkSuite
-
         # Create mock results
         mock_results = [
             BenchmarkResult(
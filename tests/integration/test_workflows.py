@@ -1,67 +1,117 @@
 """Integration tests for workflows."""
 
-from unittest.mock import Mock, patch
+import re
+from unittest.mock import Mock
 
 import pytest
 
-from local_agents.agents.coder import CodingAgent
-from local_agents.agents.planner import PlanningAgent
-from local_agents.agents.reviewer import ReviewAgent
-from local_agents.agents.tester import TestingAgent
 from local_agents.base import TaskResult
+from local_agents.config import Config, PerformanceConfig, config_manager
 from local_agents.workflows.orchestrator import Workflow
 
+_PLAN_OK = TaskResult(
+    success=True,
+    output="## Implementation Plan\n\n1. Create main function\n2. Add error handling\n3. Write tests",
+    agent_type="plan",
+    task="Create implementation plan",
+)
+
+_CODE_OK = TaskResult(
+    success=True,
+    output="```python\ndef main():\n    print('Hello World')\n```",
+    agent_type="code",
+    task="Generate code",
+)
+
+_TEST_OK = TaskResult(
+    success=True,
+    output="```python\ndef test_main():\n    assert main() is None\n```",
+    agent_type="test",
+    task="Generate tests",
+)
+
+_REVIEW_OK = TaskResult(
+    success=True,
+    output="## Code Review\n\n### Summary\nCode looks good.\n\n### Issues Found\nNone.",
+    agent_type="review",
+    task="Review code",
+)
+
+_PLAN_FAIL = TaskResult(
+    success=False,
+    output="",
+    agent_type="plan",
+    task="Create implementation plan",
+    error="Planning failed",
+)
+
+_CODE_FAIL = TaskResult(
+    success=False,
+    output="",
+    agent_type="code",
+    task="Generate code",
+    error="Code generation failed",
+)
+
+_REVIEW_FAIL = TaskResult(
+    success=False,
+    output="",
+    agent_type="review",
+    task="Review code",
+    error="Review failed",
+)
+
+_FAILURES = {
+    "planner": _PLAN_FAIL,
+    "coder": _CODE_FAIL,
+    "reviewer": _REVIEW_FAIL,
+}
+
+# Summary expectations, matched in order with a single scan of the summary
+_SUMMARY_OK_RE = re.compile(
+    r"Code-Review Workflow Summary.*Test summary generation.*1/1 steps successful.*✅", re.S
+)
+_SUMMARY_FAILED_RE = re.compile(r"0/1 steps successful.*1 failures.*❌.*Review failed", re.S)
+
+_DEFAULT_RESULTS = {
+    "planner": _PLAN_OK,
+    "coder": _CODE_OK,
+    "tester": _TEST_OK,
+    "reviewer": _REVIEW_OK,
+}
+
+
+class StubAgent:
+    """Lightweight agent stand-in that records ``execute`` calls.
+
+    Each call is stored in ``calls`` as ``(task, context, kwargs)``; set
+    ``result`` to change what ``execute`` returns.
+    """
+
+    __slots__ = ("agent_type", "result", "calls")
+
+    def __init__(self, agent_type, result):
+        self.agent_type = agent_type
+        self.result = result
+        self.calls = []
+
+    def execute(self, task, context=None, **kwargs):
+        self.calls.append((task, context, kwargs))
+        return self.result
+
 
 @pytest.fixture
 def mock_agents():
-    """Mock all agents for integration testing."""
-    agents = {}
-
-    # Mock planning agent
-    mock_planner = Mock(spec=PlanningAgent)
-    mock_planner.agent_type = "plan"
-    mock_planner.execute.return_value = TaskResult(
-        success=True,
-        output="## Implementation Plan\n\n1. Create main function\n2. Add error handling\n3. Write tests",
-        agent_type="plan",
-        task="Create implementation plan",
-    )
-    agents["planner"] = mock_planner
-
-    # Mock coding agent
-    mock_coder = Mock(spec=CodingAgent)
-    mock_coder.agent_type = "code"
-    mock_coder.execute.return_value = TaskResult(
-        success=True,
-        output="```python\ndef main():\n    print('Hello World')\n```",
-        agent_type="code",
-        task="Generate code",
-    )
-    agents["coder"] = mock_coder
-
-    # Mock testing agent
-    mock_tester = Mock(spec=TestingAgent)
-    mock_tester.agent_type = "test"
-    mock_tester.execute.return_value = TaskResult(
-        success=True,
-        output="```python\ndef test_main():\n    assert main() is None\n```",
-        agent_type="test",
-        task="Generate tests",
-    )
-    agents["tester"] = mock_tester
-
-    # Mock review agent
-    mock_reviewer = Mock(spec=ReviewAgent)
-    mock_reviewer.agent_type = "review"
-    mock_reviewer.execute.return_value = TaskResult(
-        success=True,
-        output="## Code Review\n\n### Summary\nCode looks good.\n\n### Issues Found\nNone.",
-        agent_type="review",
-        task="Review code",
-    )
-    agents["reviewer"] = mock_reviewer
+    """Stub all agents for integration testing."""
+    return {key: StubAgent(result.agent_type, result) for key, result in _DEFAULT_RESULTS.items()}
 
-    return agents
+
+def _call_counts(agents):
+    """Map each stub agent key to the number of ``execute`` calls it received."""
+    return {key: len(agent.calls) for key, agent in agents.items()}
+
+
+_AGENT_KEYS = {"plan": "planner", "code": "coder", "test": "tester", "review": "reviewer"}
 
 
 @pytest.fixture
@@ -69,92 +119,95 @@ def workflow_with_mocks(mock_agents):
     """Create workflow with mocked agents."""
     workflow = Workflow()
 
-    # Replace agent classes with mock instances
-    with patch.object(PlanningAgent, "__new__", return_value=mock_agents["planner"]):
-        with patch.object(CodingAgent, "__new__", return_value=mock_agents["coder"]):
-            with patch.object(TestingAgent, "__new__", return_value=mock_agents["tester"]):
-                with patch.object(
-                    ReviewAgent,
-                    "__new__",
-                    return_value=mock_agents["reviewer"],
-                ):
-                    yield workflow, mock_agents
+    # Point the workflow's agent registry at the mock instances
+    for agent_type, key in _AGENT_KEYS.items():
+        workflow.agents[agent_type] = lambda mock_agent=mock_agents[key]: mock_agent
 
+    return workflow, mock_agents
 
+
+@pytest.mark.xdist_group("workflow_execution")
 class TestWorkflowExecution:
     """Test workflow execution scenarios."""
 
-    def test_feature_dev_workflow_success(self, workflow_with_mocks):
-        """Test successful feature development workflow."""
+    @pytest.mark.parametrize(
+        "failing_agent,expected_success,expected_called,expected_outputs",
+        [
+            # All four steps succeed and publish their outputs to the context
+            (
+                None,
+                True,
+                ("planner", "coder", "tester", "reviewer"),
+                ("plan_output", "code_output", "test_output", "review_output"),
+            ),
+            # A failed coding step is not critical, so the workflow carries on
+            ("coder", False, ("planner", "coder", "tester", "reviewer"), ()),
+            # A failed planning step stops the workflow
+            ("planner", False, ("planner",), ()),
+        ],
+        ids=["success", "coding-failure-continues", "planning-failure-stops"],
+    )
+    def test_feature_dev_workflow(
+        self,
+        workflow_with_mocks,
+        failing_agent,
+        expected_success,
+        expected_called,
+        expected_outputs,
+    ):
+        """Test the feature development workflow with and without failing steps."""
         workflow, mock_agents = workflow_with_mocks
+        if failing_agent:
+            mock_agents[failing_agent].result = _FAILURES[failing_agent]
 
-        with patch.object(PlanningAgent, "__new__", return_value=mock_agents["planner"]):
-            with patch.object(CodingAgent, "__new__", return_value=mock_agents["coder"]):
-                with patch.object(TestingAgent, "__new__", return_value=mock_agents["tester"]):
-                    with patch.object(
-                        ReviewAgent,
-                        "__new__",
-                        return_value=mock_agents["reviewer"],
-                    ):
-                        result = workflow.execute_workflow(
-                            workflow_name="feature-dev",
-                            task="Create a hello world function",
-                            initial_context={"project_type": "python"},
-                        )
+        result = workflow.execute_workflow(
+            workflow_name="feature-dev",
+            task="Create a hello world function",
+            initial_context={"project_type": "python"},
+        )
 
         # Verify workflow completion
-        assert result.success is True
+        assert result.success is expected_success
         assert result.workflow_name == "feature-dev"
         assert result.task == "Create a hello world function"
-        assert len(result.steps) == 4  # plan, code, test, review
+        assert len(result.steps) == len(expected_called)
 
-        # Verify all agents were called
-        mock_agents["planner"].execute.assert_called_once()
-        mock_agents["coder"].execute.assert_called_once()
-        mock_agents["tester"].execute.assert_called_once()
-        mock_agents["reviewer"].execute.assert_called_once()
+        # Verify exactly the expected agents were called
+        assert _call_counts(mock_agents) == {
+            key: int(key in expected_called) for key in mock_agents
+        }
 
         # Verify context passing
-        assert "plan_output" in workflow.current_context
-        assert "code_output" in workflow.current_context
-        assert "test_output" in workflow.current_context
-        assert "review_output" in workflow.current_context
+        for output_key in expected_outputs:
+            assert output_key in workflow.current_context
 
     def test_bug_fix_workflow_success(self, workflow_with_mocks):
         """Test successful bug fix workflow."""
         workflow, mock_agents = workflow_with_mocks
 
-        with patch.object(PlanningAgent, "__new__", return_value=mock_agents["planner"]):
-            with patch.object(CodingAgent, "__new__", return_value=mock_agents["coder"]):
-                with patch.object(TestingAgent, "__new__", return_value=mock_agents["tester"]):
-                    result = workflow.execute_workflow(
-                        workflow_name="bug-fix",
-                        task="Fix null pointer exception",
-                        initial_context={"bug_report": "NPE in main function"},
-                    )
+        result = workflow.execute_workflow(
+            workflow_name="bug-fix",
+            task="Fix null pointer exception",
+            initial_context={"bug_report": "NPE in main function"},
+        )
 
         # Verify workflow completion
         assert result.success is True
         assert result.workflow_name == "bug-fix"
         assert len(result.steps) == 3  # plan, code, test
 
-        # Verify agents were called in correct order
-        mock_agents["planner"].execute.assert_called_once()
-        mock_agents["coder"].execute.assert_called_once()
-        mock_agents["tester"].execute.assert_called_once()
         # Review agent should not be called for bug-fix workflow
-        assert mock_agents["reviewer"].execute.call_count == 0
+        assert _call_counts(mock_agents) == {"planner": 1, "coder": 1, "tester": 1, "reviewer": 0}
 
     def test_code_review_workflow_success(self, workflow_with_mocks):
         """Test code review only workflow."""
         workflow, mock_agents = workflow_with_mocks
 
-        with patch.object(ReviewAgent, "__new__", return_value=mock_agents["reviewer"]):
-            result = workflow.execute_workflow(
-                workflow_name="code-review",
-                task="Review existing code",
-                initial_context={"code_file": "main.py"},
-            )
+        result = workflow.execute_workflow(
+            workflow_name="code-review",
+            task="Review existing code",
+            initial_context={"code_file": "main.py"},
+        )
 
         # Verify workflow completion
         assert result.success is True
@@ -162,94 +215,17 @@ class TestWorkflowExecution:
         assert len(result.steps) == 1  # review only
 
         # Only review agent should be called
-        mock_agents["reviewer"].execute.assert_called_once()
-        assert mock_agents["planner"].execute.call_count == 0
-        assert mock_agents["coder"].execute.call_count == 0
-        assert mock_agents["tester"].execute.call_count == 0
-
-    def test_workflow_with_failure_continues(self, workflow_with_mocks):
-        """Test that workflow continues after non-critical step failure."""
-        workflow, mock_agents = workflow_with_mocks
-
-        # Make coding step fail
-        mock_agents["coder"].execute.return_value = TaskResult(
-            success=False,
-            output="",
-            agent_type="code",
-            task="Generate code",
-            error="Code generation failed",
-        )
-
-        with patch.object(PlanningAgent, "__new__", return_value=mock_agents["planner"]):
-            with patch.object(CodingAgent, "__new__", return_value=mock_agents["coder"]):
-                with patch.object(TestingAgent, "__new__", return_value=mock_agents["tester"]):
-                    with patch.object(
-                        ReviewAgent,
-                        "__new__",
-                        return_value=mock_agents["reviewer"],
-                    ):
-                        result = workflow.execute_workflow(
-                            workflow_name="feature-dev",
-                            task="Create a hello world function",
-                        )
-
-        # Workflow should complete but not be successful overall
-        assert result.success is False
-        assert len(result.steps) == 4
-
-        # All agents should still be called
-        mock_agents["planner"].execute.assert_called_once()
-        mock_agents["coder"].execute.assert_called_once()
-        mock_agents["tester"].execute.assert_called_once()
-        mock_agents["reviewer"].execute.assert_called_once()
-
-    def test_workflow_stops_on_planning_failure(self, workflow_with_mocks):
-        """Test that workflow stops when planning step fails."""
-        workflow, mock_agents = workflow_with_mocks
-
-        # Make planning step fail
-        mock_agents["planner"].execute.return_value = TaskResult(
-            success=False,
-            output="",
-            agent_type="plan",
-            task="Create implementation plan",
-            error="Planning failed",
-        )
-
-        with patch.object(PlanningAgent, "__new__", return_value=mock_agents["planner"]):
-            with patch.object(CodingAgent, "__new__", return_value=mock_agents["coder"]):
-                with patch.object(TestingAgent, "__new__", return_value=mock_agents["tester"]):
-                    with patch.object(
-                        ReviewAgent,
-                        "__new__",
-                        return_value=mock_agents["reviewer"],
-                    ):
-                        result = workflow.execute_workflow(
-                            workflow_name="feature-dev",
-                            task="Create a hello world function",
-                        )
-
-        # Workflow should stop after planning failure
-        assert result.success is False
-        assert len(result.steps) == 1  # Only planning step
-
-        # Only planner should be called
-        mock_agents["planner"].execute.assert_called_once()
-        assert mock_agents["coder"].execute.call_count == 0
-        assert mock_agents["tester"].execute.call_count == 0
-        assert mock_agents["reviewer"].execute.call_count == 0
+        assert _call_counts(mock_agents) == {"planner": 0, "coder": 0, "tester": 0, "reviewer": 1}
 
     def test_custom_workflow_creation(self, workflow_with_mocks):
         """Test creation and execution of custom workflow."""
         workflow, mock_agents = workflow_with_mocks
 
-        with patch.object(PlanningAgent, "__new__", return_value=mock_agents["planner"]):
-            with patch.object(TestingAgent, "__new__", return_value=mock_agents["tester"]):
-                result = workflow.create_custom_workflow(
-                    steps=["plan", "test"],
-                    task="Create test-first workflow",
-                    context={"approach": "TDD"},
-                )
+        result = workflow.create_custom_workflow(
+            steps=["plan", "test"],
+            task="Create test-first workflow",
+            context={"approach": "TDD"},
+        )
 
         # Verify custom workflow execution
         assert result.success is True
@@ -257,31 +233,25 @@ class TestWorkflowExecution:
         assert len(result.steps) == 2
 
         # Verify correct agents were called
-        mock_agents["planner"].execute.assert_called_once()
-        mock_agents["tester"].execute.assert_called_once()
-        assert mock_agents["coder"].execute.call_count == 0
-        assert mock_agents["reviewer"].execute.call_count == 0
+        assert _call_counts(mock_agents) == {"planner": 1, "coder": 0, "tester": 1, "reviewer": 0}
 
     def test_workflow_context_passing(self, workflow_with_mocks):
         """Test that context is properly passed between workflow steps."""
         workflow, mock_agents = workflow_with_mocks
 
-        with patch.object(PlanningAgent, "__new__", return_value=mock_agents["planner"]):
-            with patch.object(CodingAgent, "__new__", return_value=mock_agents["coder"]):
-                result = workflow.execute_workflow(
-                    workflow_name="feature-dev",
-                    task="Create a hello world function",
-                    initial_context={"framework": "flask", "version": "2.0"},
-                )
+        result = workflow.execute_workflow(
+            workflow_name="feature-dev",
+            task="Create a hello world function",
+            initial_context={"framework": "flask", "version": "2.0"},
+        )
 
         # Check that planner received initial context
-        planner_call_args = mock_agents["planner"].execute.call_args
-        assert "framework" in planner_call_args[0][1]  # context is second argument
-        assert planner_call_args[0][1]["framework"] == "flask"
+        _, planner_context, _ = mock_agents["planner"].calls[-1]
+        assert "framework" in planner_context
+        assert planner_context["framework"] == "flask"
 
         # Check that coder received context including planner output
-        coder_call_args = mock_agents["coder"].execute.call_args
-        coder_context = coder_call_args[0][1]
+        _, coder_context, _ = mock_agents["coder"].calls[-1]
         assert "framework" in coder_context
         assert "plan_output" in coder_context or "implementation_plan" in coder_context
 
@@ -300,6 +270,7 @@ class TestWorkflowExecution:
             workflow.create_custom_workflow(steps=["plan", "invalid", "test"], task="Test task")
 
 
+@pytest.mark.xdist_group("workflow_dependencies")
 class TestWorkflowDependencies:
     """Test workflow step dependencies."""
 
@@ -308,25 +279,15 @@ class TestWorkflowDependencies:
         workflow, mock_agents = workflow_with_mocks
 
         # Make planning step fail but not abort workflow
-        mock_agents["planner"].execute.return_value = TaskResult(
-            success=False,
-            output="",
-            agent_type="plan",
-            task="Create plan",
-            error="Planning failed",
-        )
+        mock_agents["planner"].result = _PLAN_FAIL
 
-        with patch.object(PlanningAgent, "__new__", return_value=mock_agents["planner"]):
-            with patch.object(CodingAgent, "__new__", return_value=mock_agents["coder"]):
-                # Force workflow to continue after planning failure
-                workflow._should_continue_after_failure = Mock(return_value=True)
+        # Force workflow to continue after planning failure
+        workflow._should_continue_after_failure = Mock(return_value=True)
 
-                result = workflow.execute_workflow(
-                    workflow_name="feature-dev", task="Test dependencies"
-                )
+        result = workflow.execute_workflow(workflow_name="feature-dev", task="Test dependencies")
 
         # Planner should be called, but coder should be skipped due to dependency failure
-        mock_agents["planner"].execute.assert_called_once()
+        assert len(mock_agents["planner"].calls) == 1
         # Note: Actual dependency checking behavior depends on implementation details
         # This test verifies the framework is in place
 
@@ -334,79 +295,160 @@ class TestWorkflowDependencies:
         """Test that successful dependencies allow subsequent steps."""
         workflow, mock_agents = workflow_with_mocks
 
-        with patch.object(PlanningAgent, "__new__", return_value=mock_agents["planner"]):
-            with patch.object(CodingAgent, "__new__", return_value=mock_agents["coder"]):
-                result = workflow.execute_workflow(
-                    workflow_name="feature-dev",
-                    task="Test successful dependencies",
-                )
+        result = workflow.execute_workflow(
+            workflow_name="feature-dev",
+            task="Test successful dependencies",
+        )
 
         # Both steps should execute successfully
-        mock_agents["planner"].execute.assert_called_once()
-        mock_agents["coder"].execute.assert_called_once()
+        assert len(mock_agents["planner"].calls) == 1
+        assert len(mock_agents["coder"].calls) == 1
 
         # Verify that coding step received context from planning step
-        coder_call_args = mock_agents["coder"].execute.call_args
-        coder_context = coder_call_args[0][1]
+        _, coder_context, _ = mock_agents["coder"].calls[-1]
         # Context should contain planning output (exact key depends on implementation)
         assert any("plan" in key for key in coder_context.keys())
 
+    @pytest.mark.parametrize(
+        "enable_parallel,expected_concurrent", [(True, 1), (False, 0)], ids=["parallel", "serial"]
+    )
+    def test_independent_steps_share_a_group(
+        self, workflow_with_mocks, monkeypatch, enable_parallel, expected_concurrent
+    ):
+        """Test that test and review, which only depend on code, run as one group."""
+        workflow, mock_agents = workflow_with_mocks
+
+        # Use the built-in definition, which declares the step dependencies
+        monkeypatch.setattr(config_manager, "get_workflow_steps", lambda workflow_name: [])
+
+        result = workflow.execute_workflow(
+            workflow_name="feature-dev",
+            task="Test parallel steps",
+            enable_parallel=enable_parallel,
+        )
+
+        # Results keep the workflow definition order either way
+        assert [step.agent_type for step in result.steps] == ["plan", "code", "test", "review"]
+        assert workflow.execution_stats["concurrent_executions"] == expected_concurrent
+
+        # Grouped steps see the code output but not each other's output
+        _, review_context, _ = mock_agents["reviewer"].calls[-1]
+        assert "code_to_review" in review_context
+        assert ("test_output" in review_context) is not enable_parallel
 
+    def test_configured_steps_run_in_order_by_default(self, workflow_with_mocks):
+        """Test that concurrency is opt-in, so review sees the test output by default."""
+        workflow, mock_agents = workflow_with_mocks
+
+        result = workflow.execute_workflow(workflow_name="feature-dev", task="Test default run")
+
+        assert result.success is True
+        assert workflow.execution_stats["concurrent_executions"] == 0
+        _, review_context, _ = mock_agents["reviewer"].calls[-1]
+        assert "test_output" in review_context
+
+    @pytest.mark.parametrize("workflow_name", ["feature-dev", "refactor"])
+    def test_configured_steps_share_a_group(self, workflow_with_mocks, workflow_name):
+        """Test that the configured workflow runs test and review as one group on request."""
+        workflow, mock_agents = workflow_with_mocks
+
+        result = workflow.execute_workflow(
+            workflow_name=workflow_name, task="Test parallel steps", enable_parallel=True
+        )
+
+        assert result.success is True
+        assert [step.agent_type for step in result.steps] == ["plan", "code", "test", "review"]
+        assert workflow.execution_stats["concurrent_executions"] == 1
+
+    def test_parallel_workflows_config_flag_disables_groups(self, workflow_with_mocks, monkeypatch):
+        """Test that performance.enable_parallel_workflows=False overrides enable_parallel."""
+        workflow, mock_agents = workflow_with_mocks
+        config = Config(performance=PerformanceConfig(enable_parallel_workflows=False))
+        monkeypatch.setattr(config_manager, "load_config", lambda: config)
+
+        workflow.execute_workflow(
+            workflow_name="feature-dev", task="Test parallel steps", enable_parallel=True
+        )
+
+        assert workflow.execution_stats["concurrent_executions"] == 0
+
+    def test_failed_dependency_runs_dependents_in_turn(self, workflow_with_mocks):
+        """Test that test and review still run, ungrouped, after a failed coding step."""
+        workflow, mock_agents = workflow_with_mocks
+        mock_agents["coder"].result = _CODE_FAIL
+
+        result = workflow.execute_workflow(
+            workflow_name="feature-dev", task="Test failure", enable_parallel=True
+        )
+
+        assert [step.agent_type for step in result.steps] == ["plan", "code", "test", "review"]
+        assert workflow.execution_stats["concurrent_executions"] == 0
+
+    def test_failed_dependency_skips_builtin_dependents(self, workflow_with_mocks, monkeypatch):
+        """Test that built-in steps whose dependency failed are skipped, not run."""
+        workflow, mock_agents = workflow_with_mocks
+        mock_agents["coder"].result = _CODE_FAIL
+        monkeypatch.setattr(config_manager, "get_workflow_steps", lambda workflow_name: [])
+
+        result = workflow.execute_workflow(
+            workflow_name="feature-dev", task="Test failure", enable_parallel=True
+        )
+
+        assert [step.agent_type for step in result.steps] == ["plan", "code"]
+        assert mock_agents["tester"].calls == []
+        assert mock_agents["reviewer"].calls == []
+
+
+@pytest.fixture(scope="class")
+def review_workflow(request):
+    """Create a workflow whose only agent is a reviewer stub returning ``request.param``.
+
+    Parametrized indirectly, so tests expecting the same review result share one
+    workflow per class.
+    """
+    reviewer = StubAgent("review", request.param)
+    workflow = Workflow()
+    workflow.agents = {"review": lambda: reviewer}
+    return workflow, reviewer
+
+
+@pytest.mark.xdist_group("workflow_output")
 class TestWorkflowStreamingAndOutput:
     """Test workflow streaming and output handling."""
 
-    def test_workflow_streaming_parameter_passed(self, workflow_with_mocks):
+    @pytest.mark.parametrize("review_workflow", [_REVIEW_OK], ids=["review-ok"], indirect=True)
+    def test_workflow_streaming_parameter_passed(self, review_workflow):
         """Test that streaming parameter is passed to agents."""
-        workflow, mock_agents = workflow_with_mocks
+        workflow, reviewer = review_workflow
 
-        with patch.object(ReviewAgent, "__new__", return_value=mock_agents["reviewer"]):
-            workflow.execute_workflow(
-                workflow_name="code-review", task="Test streaming", stream=True
-            )
+        workflow.execute_workflow(workflow_name="code-review", task="Test streaming", stream=True)
 
         # Verify streaming parameter was passed to agent
-        reviewer_call_args = mock_agents["reviewer"].execute.call_args
-        assert reviewer_call_args[1]["stream"] is True  # stream is keyword argument
+        _, _, reviewer_kwargs = reviewer.calls[-1]
+        assert reviewer_kwargs["stream"] is True  # stream is keyword argument
 
-    def test_workflow_summary_generation(self, workflow_with_mocks):
+    @pytest.mark.parametrize("review_workflow", [_REVIEW_OK], ids=["review-ok"], indirect=True)
+    def test_workflow_summary_generation(self, review_workflow):
         """Test that workflow generates proper summary."""
-        workflow, mock_agents = workflow_with_mocks
+        workflow, _ = review_workflow
 
-        with patch.object(ReviewAgent, "__new__", return_value=mock_agents["reviewer"]):
-            result = workflow.execute_workflow(
-                workflow_name="code-review", task="Test summary generation"
-            )
+        result = workflow.execute_workflow(
+            workflow_name="code-review", task="Test summary generation"
+        )
 
         # Verify summary is generated
         assert hasattr(result, "summary")
-        summary = result.summary
-        assert "Code-Review Workflow Summary" in summary
-        assert "Test summary generation" in summary
-        assert "1/1 steps successful" in summary
-        assert "✅" in summary  # Success indicator
+        assert _SUMMARY_OK_RE.search(result.summary)
 
-    def test_workflow_summary_with_failures(self, workflow_with_mocks):
+    @pytest.mark.parametrize(
+        "review_workflow", [_REVIEW_FAIL], ids=["review-failed"], indirect=True
+    )
+    def test_workflow_summary_with_failures(self, review_workflow):
         """Test workflow summary when there are failures."""
-        workflow, mock_agents = workflow_with_mocks
-
-        # Make review step fail
-        mock_agents["reviewer"].execute.return_value = TaskResult(
-            success=False,
-            output="",
-            agent_type="review",
-            task="Review code",
-            error="Review failed",
-        )
+        workflow, _ = review_workflow
 
-        with patch.object(ReviewAgent, "__new__", return_value=mock_agents["reviewer"]):
-            result = workflow.execute_workflow(
-                workflow_name="code-review", task="Test failure summary"
-            )
+        result = workflow.execute_workflow(workflow_name="code-review", task="Test failure summary")
 
         # Verify failure summary
         assert result.success is False
-        summary = result.summary
-        assert "0/1 steps successful" in summary
-        assert "1 failures" in summary
-        assert "❌" in summary  # Failure indicator
-        assert "Review failed" in summary
+        assert _SUMMARY_FAILED_RE.search(result.summary)
@@ -9,50 +9,78 @@ the benchmarks defined in the testing plan:
 - Code review: < 60 seconds (including static analysis)
 - Workflow execution: < 120 seconds
 - Memory usage: < 4GB peak during workflow
+
+The mocked model calls return immediately. Set ``LOCAL_AGENTS_SIM_DELAY``
+to a number of seconds to simulate model latency on every call.
 """
 
-import threading
+import gc
+import json
+import os
+import subprocess
+import sys
 import time
+from contextlib import contextmanager
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import psutil
 import pytest
 
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
 from local_agents.agents.coder import CodingAgent
 from local_agents.agents.planner import PlanningAgent
 from local_agents.agents.reviewer import ReviewAgent
 from local_agents.agents.tester import TestingAgent
-from local_agents.ollama_client import OllamaClient
 from local_agents.workflows.orchestrator import Workflow
 
+# Benchmarks only run when selected with ``-m performance``
+pytestmark = pytest.mark.performance
+
+# Simulated model latency in seconds; the benchmarks only assert upper bounds
+SIMULATED_DELAY = float(os.getenv("LOCAL_AGENTS_SIM_DELAY", "0"))
+
+
+def _peak_rss_bytes():
+    """Return the peak resident set size of this process in bytes."""
+    if resource is None:
+        # No getrusage (Windows): fall back to the current RSS
+        return psutil.Process().memory_info().rss
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
 
 class PerformanceMonitor:
-    """Monitor system resources during test execution."""
+    """Monitor system resources during test execution.
+
+    Peak memory comes from the kernel-maintained ``ru_maxrss`` high-water mark,
+    read once when monitoring starts and once when it stops, so no sampler
+    thread is needed.
+    """
 
     def __init__(self):
-        self.process = psutil.Process()
         self.start_time = None
         self.end_time = None
         self.peak_memory = 0
-        self.monitoring = False
-        self.monitor_thread = None
+        self.metrics = None
+        self._start_peak_memory = 0
 
     def start_monitoring(self):
         """Start performance monitoring."""
         self.start_time = time.time()
         self.peak_memory = 0
-        self.monitoring = True
-        self.monitor_thread = threading.Thread(target=self._monitor_resources)
-        self.monitor_thread.daemon = True
-        self.monitor_thread.start()
+        self._start_peak_memory = _peak_rss_bytes()
 
     def stop_monitoring(self):
         """Stop performance monitoring and return metrics."""
         self.end_time = time.time()
-        self.monitoring = False
-        if self.monitor_thread:
-            self.monitor_thread.join(timeout=1)
+        self.peak_memory = max(_peak_rss_bytes(), self._start_peak_memory)
 
         return {
             "execution_time": self.end_time - self.start_time,
@@ -60,175 +88,104 @@ class PerformanceMonitor:
             "peak_memory_gb": self.peak_memory / (1024 * 1024 * 1024),
         }
 
-    def _monitor_resources(self):
-        """Monitor resources in background thread."""
-        while self.monitoring:
-            try:
-                memory_info = self.process.memory_info()
-                current_memory = memory_info.rss
-                if current_memory > self.peak_memory:
-                    self.peak_memory = current_memory
-                time.sleep(0.1)  # Sample every 100ms
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                break
-
-
-@pytest.fixture
-def mock_ollama_client():
-    """Create a mock Ollama client with realistic response times."""
-    client = Mock(spec=OllamaClient)
-    client.is_model_available.return_value = True
 
-    def mock_generate(*args, **kwargs):
-        # Simulate realistic response times
-        time.sleep(0.5)  # 500ms simulated processing
-        return "Mock response content"
-
-    client.generate.side_effect = mock_generate
-    return client
+def _delayed_response(*args, **kwargs):
+    """Return a canned model response after the simulated model latency."""
+    time.sleep(SIMULATED_DELAY)
+    return "Mock response"
 
 
 @pytest.fixture
-def performance_monitor():
-    """Create a performance monitor for tests."""
-    return PerformanceMonitor()
-
-
-class TestingAgentPerformanceBenchmarks:
-    """Test individual agent performance benchmarks."""
+def mock_ollama_client(mock_ollama_client):
+    """Add the optional simulated latency to the shared mock Ollama client."""
+    if SIMULATED_DELAY:
+        mock_ollama_client.generate.side_effect = _delayed_response
+        mock_ollama_client.chat.side_effect = _delayed_response
+    return mock_ollama_client
+
+
+@pytest.fixture(scope="module")
+def mock_agents_for_workflow():
+    """Create mock agents optimized for workflow testing."""
+    agents = {}
+
+    def create_mock_agent(agent_type):
+        mock_agent = Mock()
+        mock_agent.agent_type = agent_type
+
+        def mock_execute(*args, **kwargs):
+            if SIMULATED_DELAY:
+                time.sleep(SIMULATED_DELAY)  # Simulate processing time
+            return Mock(
+                success=True,
+                output=f"Mock {agent_type} output",
+                agent_type=agent_type,
+                task=args[0] if args else "test task",
+                context=args[1] if len(args) > 1 else {},
+                error=None,
+            )
 
-    def test_planning_agent_performance_benchmark(self, mock_ollama_client, performance_monitor):
-        """Test planning agent meets < 30 second benchmark."""
-        agent = PlanningAgent(model="test:model", ollama_client=mock_ollama_client)
+        mock_agent.execute.side_effect = mock_execute
+        return mock_agent
 
-        performance_monitor.start_monitoring()
+    agents["planner"] = create_mock_agent("plan")
+    agents["coder"] = create_mock_agent("code")
+    agents["tester"] = create_mock_agent("test")
+    agents["reviewer"] = create_mock_agent("review")
 
-        # Execute typical planning task
-        result = agent.execute(
-            "Create a comprehensive implementation plan for a user authentication system with JWT tokens, password hashing, role-based access control, and secure session management",
-            {
-                "requirements": ["Security", "Scalability", "Maintainability"],
-                "technologies": ["Python", "FastAPI", "PostgreSQL", "Redis"],
-                "constraints": ["GDPR compliance", "High availability"],
-            },
-        )
+    return agents
 
-        metrics = performance_monitor.stop_monitoring()
 
-        # Verify benchmark
-        assert (
-            metrics["execution_time"] < 30.0
-        ), f"Planning took {metrics['execution_time']:.2f}s, exceeds 30s benchmark"
-        assert result.success is True
+_AGENT_KEYS = {"plan": "planner", "code": "coder", "test": "tester", "review": "reviewer"}
 
-        # Log performance metrics
-        print(
-            f"Planning Performance: {metrics['execution_time']:.2f}s, Peak Memory: {metrics['peak_memory_mb']:.1f}MB"
-        )
-
-    def test_coding_agent_performance_benchmark(self, mock_ollama_client, performance_monitor):
-        """Test coding agent meets < 45 second benchmark."""
-        agent = CodingAgent(model="test:model", ollama_client=mock_ollama_client)
-
-        performance_monitor.start_monitoring()
-
-        # Execute complex coding task
-        result = agent.execute(
-            "Implement a complete REST API for user management with authentication, CRUD operations, input validation, error handling, and comprehensive logging",
-            {
-                "language": "python",
-                "framework": "fastapi",
-                "database": "postgresql",
-                "requirements": [
-                    "JWT authentication",
-                    "Input validation with Pydantic",
-                    "Async/await patterns",
-                    "Comprehensive error handling",
-                    "API documentation",
-                    "Database migrations",
-                ],
-            },
-        )
-
-        metrics = performance_monitor.stop_monitoring()
 
-        # Verify benchmark
-        assert (
-            metrics["execution_time"] < 45.0
-        ), f"Coding took {metrics['execution_time']:.2f}s, exceeds 45s benchmark"
-        assert result.success is True
+def _workflow_with_agents(agents):
+    """Create a workflow whose agent registry hands out the given mock agents."""
+    workflow = Workflow()
+    for agent_type, key in _AGENT_KEYS.items():
+        workflow.agents[agent_type] = lambda mock_agent=agents[key]: mock_agent
+    return workflow
 
-        print(
-            f"Coding Performance: {metrics['execution_time']:.2f}s, Peak Memory: {metrics['peak_memory_mb']:.1f}MB"
-        )
 
-    def test_testing_agent_performance_benchmark(self, mock_ollama_client, performance_monitor):
-        """Test testing agent meets < 30 second benchmark."""
-        agent = TestingAgent(model="test:model", ollama_client=mock_ollama_client)
+@pytest.fixture(scope="session")
+def _perf_log_file(pytestconfig):
+    """Open the session's benchmark log, ``build/perf.jsonl`` (one per xdist worker)."""
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    path = pytestconfig.rootpath / "build" / (f"perf-{worker}.jsonl" if worker else "perf.jsonl")
+    path.parent.mkdir(exist_ok=True)
+    with path.open("w") as log_file:
+        yield log_file
 
-        performance_monitor.start_monitoring()
 
-        # Execute comprehensive testing task
-        result = agent.execute(
-            "Generate comprehensive test suite for user authentication API including unit tests, integration tests, security tests, and performance tests",
-            {
-                "framework": "pytest",
-                "code_to_test": """
-class UserAuthenticator:
-    def authenticate(self, username, password):
-        # Complex authentication logic
-        pass
-    
-    def authorize(self, user, resource, action):
-        # Authorization logic
-        pass
-    
-    def create_jwt_token(self, user):
-        # JWT token creation
-        pass
-""",
-                "test_types": [
-                    "unit_tests",
-                    "integration_tests",
-                    "security_tests",
-                    "performance_tests",
-                ],
-            },
-        )
-
-        metrics = performance_monitor.stop_monitoring()
-
-        # Verify benchmark
-        assert (
-            metrics["execution_time"] < 30.0
-        ), f"Testing took {metrics['execution_time']:.2f}s, exceeds 30s benchmark"
-        assert result.success is True
+@pytest.fixture
+def perf_log(request, _perf_log_file):
+    """Record a benchmark's metrics as one JSON line tagged with the test name."""
+
+    def write(metrics, **extra):
+        record = {
+            "test": request.node.name,
+            "time_s": metrics["execution_time"],
+            "peak_mb": metrics["peak_memory_mb"],
+            **extra,
+        }
+        _perf_log_file.write(json.dumps(record) + "\n")
 
-        print(
-            f"Testing Performance: {metrics['execution_time']:.2f}s, Peak Memory: {metrics['peak_memory_mb']:.1f}MB"
-        )
+    return write
 
-    @patch("subprocess.run")
-    def test_review_agent_performance_benchmark(
-        self, mock_subprocess, mock_ollama_client, performance_monitor
-    ):
-        """Test review agent meets < 60 second benchmark (including static analysis)."""
-        # Mock static analysis tools
-        mock_subprocess.return_value = Mock(
-            returncode=0,
-            stdout="test.py:1:1: E302 expected 2 blank lines",
-            stderr="",
-        )
 
-        agent = ReviewAgent(model="test:model", ollama_client=mock_ollama_client)
+@contextmanager
+def perf():
+    """Monitor the enclosed block; its metrics are on ``monitor.metrics`` afterwards."""
+    monitor = PerformanceMonitor()
+    monitor.start_monitoring()
+    try:
+        yield monitor
+    finally:
+        monitor.metrics = monitor.stop_monitoring()
 
-        performance_monitor.start_monitoring()
 
-        # Execute comprehensive review task
-        result = agent.execute(
-            "Perform comprehensive code review including security analysis, performance assessment, maintainability evaluation, and static analysis",
-            {
-                "code_content": """
+# Sample authentication module for the review benchmarks
+_SAMPLE_AUTH_CODE = """
 import hashlib
 import jwt
 from datetime import datetime, timedelta
@@ -273,107 +230,163 @@ class UserAuthenticator:
             'iat': datetime.utcnow()
         }
         return jwt.encode(payload, self.secret_key, algorithm='HS256')
+"""
+
+# (agent class, task, context, time limit in seconds, label for the log line).
+# Each agent has its own xdist group so ``-n auto --dist=loadgroup`` spreads them
+# across workers.
+AGENT_CASES = [
+    pytest.param(
+        PlanningAgent,
+        "Create a comprehensive implementation plan for a user authentication system with JWT tokens, password hashing, role-based access control, and secure session management",
+        {
+            "requirements": ["Security", "Scalability", "Maintainability"],
+            "technologies": ["Python", "FastAPI", "PostgreSQL", "Redis"],
+            "constraints": ["GDPR compliance", "High availability"],
+        },
+        30.0,
+        "Planning",
+        id="planning",
+        marks=pytest.mark.xdist_group("perf_planning"),
+    ),
+    pytest.param(
+        CodingAgent,
+        "Implement a complete REST API for user management with authentication, CRUD operations, input validation, error handling, and comprehensive logging",
+        {
+            "language": "python",
+            "framework": "fastapi",
+            "database": "postgresql",
+            "requirements": [
+                "JWT authentication",
+                "Input validation with Pydantic",
+                "Async/await patterns",
+                "Comprehensive error handling",
+                "API documentation",
+                "Database migrations",
+            ],
+        },
+        45.0,
+        "Coding",
+        id="coding",
+        marks=pytest.mark.xdist_group("perf_coding"),
+    ),
+    pytest.param(
+        TestingAgent,
+        "Generate comprehensive test suite for user authentication API including unit tests, integration tests, security tests, and performance tests",
+        {
+            "framework": "pytest",
+            "code_to_test": """
+class UserAuthenticator:
+    def authenticate(self, username, password):
+        # Complex authentication logic
+        pass
+    
+    def authorize(self, user, resource, action):
+        # Authorization logic
+        pass
+    
+    def create_jwt_token(self, user):
+        # JWT token creation
+        pass
 """,
-                "focus_area": "all",
-                "enable_static_analysis": True,
-                "analysis_tools": ["flake8", "pylint", "bandit", "mypy"],
-            },
-        )
+            "test_types": [
+                "unit_tests",
+                "integration_tests",
+                "security_tests",
+                "performance_tests",
+            ],
+        },
+        30.0,
+        "Testing",
+        id="testing",
+        marks=pytest.mark.xdist_group("perf_testing"),
+    ),
+    # The review limit includes static analysis overhead
+    pytest.param(
+        ReviewAgent,
+        "Perform comprehensive code review including security analysis, performance assessment, maintainability evaluation, and static analysis",
+        {
+            "code_content": _SAMPLE_AUTH_CODE,
+            "focus_area": "all",
+            "enable_static_analysis": True,
+            "analysis_tools": ["flake8", "pylint", "bandit", "mypy"],
+        },
+        60.0,
+        "Review",
+        id="review",
+        marks=pytest.mark.xdist_group("perf_review"),
+    ),
+]
+
+
+# Canned output shared by every mocked static analysis run
+_STATIC_ANALYSIS_RESULT = subprocess.CompletedProcess(
+    args=[], returncode=0, stdout="test.py:1:1: E302 expected 2 blank lines", stderr=""
+)
+
+
+class TestingAgentPerformanceBenchmarks:
+    """Test individual agent performance benchmarks."""
+
+    @pytest.mark.parametrize("agent_cls,task,context,limit,label", AGENT_CASES)
+    @patch("subprocess.run")
+    def test_agent_performance_benchmark(
+        self,
+        mock_subprocess,
+        mock_ollama_client,
+        perf_log,
+        agent_cls,
+        task,
+        context,
+        limit,
+        label,
+    ):
+        """Test each agent meets its execution time benchmark."""
+        # Mock static analysis tools
+        mock_subprocess.return_value = _STATIC_ANALYSIS_RESULT
 
-        metrics = performance_monitor.stop_monitoring()
+        agent = agent_cls(model="test:model", ollama_client=mock_ollama_client)
 
-        # Verify benchmark (including static analysis overhead)
+        with perf() as monitor:
+            result = agent.execute(task, context)
+        metrics = monitor.metrics
+
+        # Verify benchmark
         assert (
-            metrics["execution_time"] < 60.0
-        ), f"Review took {metrics['execution_time']:.2f}s, exceeds 60s benchmark"
+            metrics["execution_time"] < limit
+        ), f"{label} took {metrics['execution_time']:.2f}s, exceeds {limit:.0f}s benchmark"
         assert result.success is True
 
-        print(
-            f"Review Performance: {metrics['execution_time']:.2f}s, Peak Memory: {metrics['peak_memory_mb']:.1f}MB"
-        )
+        # Log performance metrics
+        perf_log(metrics)
 
 
 class TestWorkflowPerformanceBenchmarks:
     """Test workflow performance benchmarks."""
 
-    @pytest.fixture
-    def mock_agents_for_workflow(self, mock_ollama_client):
-        """Create mock agents optimized for workflow testing."""
-        agents = {}
-
-        # Create agents with realistic timing
-        def create_mock_agent(agent_type, base_delay=0.5):
-            mock_agent = Mock()
-            mock_agent.agent_type = agent_type
-
-            def mock_execute(*args, **kwargs):
-                time.sleep(base_delay)  # Simulate processing time
-                return Mock(
-                    success=True,
-                    output=f"Mock {agent_type} output",
-                    agent_type=agent_type,
-                    task=args[0] if args else "test task",
-                    context=args[1] if len(args) > 1 else {},
-                    error=None,
-                )
-
-            mock_agent.execute.side_effect = mock_execute
-            return mock_agent
-
-        agents["planner"] = create_mock_agent("plan", 0.8)
-        agents["coder"] = create_mock_agent("code", 1.0)
-        agents["tester"] = create_mock_agent("test", 0.7)
-        agents["reviewer"] = create_mock_agent("review", 1.2)
-
-        return agents
-
-    def test_feature_development_workflow_benchmark(
-        self, mock_agents_for_workflow, performance_monitor
-    ):
+    def test_feature_development_workflow_benchmark(self, mock_agents_for_workflow, perf_log):
         """Test feature development workflow meets < 120 second benchmark."""
-        workflow = Workflow()
-
-        performance_monitor.start_monitoring()
-
-        with patch.object(
-            PlanningAgent,
-            "__new__",
-            return_value=mock_agents_for_workflow["planner"],
-        ):
-            with patch.object(
-                CodingAgent,
-                "__new__",
-                return_value=mock_agents_for_workflow["coder"],
-            ):
-                with patch.object(
-                    TestingAgent,
-                    "__new__",
-                    return_value=mock_agents_for_workflow["tester"],
-                ):
-                    with patch.object(
-                        ReviewAgent,
-                        "__new__",
-                        return_value=mock_agents_for_workflow["reviewer"],
-                    ):
-                        result = workflow.execute_workflow(
-                            "feature-dev",
-                            "Develop complete user authentication system with comprehensive security features",
-                            {
-                                "language": "python",
-                                "framework": "fastapi",
-                                "database": "postgresql",
-                                "requirements": [
-                                    "JWT authentication",
-                                    "Password hashing with salt",
-                                    "Role-based access control",
-                                    "Session management",
-                                    "Rate limiting",
-                                    "Audit logging",
-                                ],
-                            },
-                        )
-
-        metrics = performance_monitor.stop_monitoring()
+        workflow = _workflow_with_agents(mock_agents_for_workflow)
+
+        with perf() as monitor:
+            result = workflow.execute_workflow(
+                "feature-dev",
+                "Develop complete user authentication system with comprehensive security features",
+                {
+                    "language": "python",
+                    "framework": "fastapi",
+                    "database": "postgresql",
+                    "requirements": [
+                        "JWT authentication",
+                        "Password hashing with salt",
+                        "Role-based access control",
+                        "Session management",
+                        "Rate limiting",
+                        "Audit logging",
+                    ],
+                },
+            )
+        metrics = monitor.metrics
 
         # Verify benchmark
         assert (
@@ -382,45 +395,26 @@ class TestWorkflowPerformanceBenchmarks:
         assert result.success is True
         assert len(result.steps) == 4  # plan, code, test, review
 
-        print(
-            f"Feature Development Workflow: {metrics['execution_time']:.2f}s, Peak Memory: {metrics['peak_memory_mb']:.1f}MB"
-        )
+        perf_log(metrics)
 
-    def test_bug_fix_workflow_benchmark(self, mock_agents_for_workflow, performance_monitor):
+    def test_bug_fix_workflow_benchmark(self, mock_agents_for_workflow, perf_log):
         """Test bug fix workflow performance."""
-        workflow = Workflow()
-
-        performance_monitor.start_monitoring()
-
-        with patch.object(
-            PlanningAgent,
-            "__new__",
-            return_value=mock_agents_for_workflow["planner"],
-        ):
-            with patch.object(
-                CodingAgent,
-                "__new__",
-                return_value=mock_agents_for_workflow["coder"],
-            ):
-                with patch.object(
-                    TestingAgent,
-                    "__new__",
-                    return_value=mock_agents_for_workflow["tester"],
-                ):
-                    result = workflow.execute_workflow(
-                        "bug-fix",
-                        "Fix critical security vulnerability in JWT token validation",
-                        {
-                            "bug_report": "JWT tokens can be forged due to missing signature validation",
-                            "priority": "critical",
-                            "affected_components": [
-                                "authentication",
-                                "authorization",
-                            ],
-                        },
-                    )
-
-        metrics = performance_monitor.stop_monitoring()
+        workflow = _workflow_with_agents(mock_agents_for_workflow)
+
+        with perf() as monitor:
+            result = workflow.execute_workflow(
+                "bug-fix",
+                "Fix critical security vulnerability in JWT token validation",
+                {
+                    "bug_report": "JWT tokens can be forged due to missing signature validation",
+                    "priority": "critical",
+                    "affected_components": [
+                        "authentication",
+                        "authorization",
+                    ],
+                },
+            )
+        metrics = monitor.metrics
 
         # Bug fix should be faster than full feature development
         assert (
@@ -428,21 +422,13 @@ class TestWorkflowPerformanceBenchmarks:
         ), f"Bug fix workflow took {metrics['execution_time']:.2f}s, exceeds expected 90s"
         assert result.success is True
 
-        print(
-            f"Bug Fix Workflow: {metrics['execution_time']:.2f}s, Peak Memory: {metrics['peak_memory_mb']:.1f}MB"
-        )
+        perf_log(metrics)
 
-    def test_code_review_workflow_benchmark(self, mock_agents_for_workflow, performance_monitor):
+    def test_code_review_workflow_benchmark(self, mock_agents_for_workflow, perf_log):
         """Test code review workflow performance."""
-        workflow = Workflow()
-
-        performance_monitor.start_monitoring()
+        workflow = _workflow_with_agents(mock_agents_for_workflow)
 
-        with patch.object(
-            ReviewAgent,
-            "__new__",
-            return_value=mock_agents_for_workflow["reviewer"],
-        ):
+        with perf() as monitor:
             result = workflow.execute_workflow(
                 "code-review",
                 "Review complete authentication module for security and performance",
@@ -455,8 +441,7 @@ class TestWorkflowPerformanceBenchmarks:
                     ],
                 },
             )
-
-        metrics = performance_monitor.stop_monitoring()
+        metrics = monitor.metrics
 
         # Code review should be fast (single step)
         assert (
@@ -464,59 +449,33 @@ class TestWorkflowPerformanceBenchmarks:
         ), f"Code review workflow took {metrics['execution_time']:.2f}s, exceeds 60s benchmark"
         assert result.success is True
 
-        print(
-            f"Code Review Workflow: {metrics['execution_time']:.2f}s, Peak Memory: {metrics['peak_memory_mb']:.1f}MB"
-        )
+        perf_log(metrics)
 
 
 class TestMemoryUsageBenchmarks:
     """Test memory usage benchmarks."""
 
-    def test_workflow_memory_usage_benchmark(self, mock_agents_for_workflow, performance_monitor):
+    def test_workflow_memory_usage_benchmark(self, mock_agents_for_workflow, perf_log):
         """Test that workflow execution stays under 4GB memory benchmark."""
-        workflow = Workflow()
-
-        performance_monitor.start_monitoring()
-
-        # Execute multiple workflows to stress test memory usage
-        workflows_to_test = [
-            ("feature-dev", "Create user management system"),
-            ("bug-fix", "Fix authentication bug"),
-            ("code-review", "Review security implementation"),
-            ("refactor", "Refactor authentication module"),
-        ]
-
-        with patch.object(
-            PlanningAgent,
-            "__new__",
-            return_value=mock_agents_for_workflow["planner"],
-        ):
-            with patch.object(
-                CodingAgent,
-                "__new__",
-                return_value=mock_agents_for_workflow["coder"],
-            ):
-                with patch.object(
-                    TestingAgent,
-                    "__new__",
-                    return_value=mock_agents_for_workflow["tester"],
-                ):
-                    with patch.object(
-                        ReviewAgent,
-                        "__new__",
-                        return_value=mock_agents_for_workflow["reviewer"],
-                    ):
-                        results = []
-                        for workflow_name, task in workflows_to_test:
-                            result = workflow.execute_workflow(workflow_name, task)
-                            results.append(result)
-
-                            # Force garbage collection between workflows
-                            import gc
-
-                            gc.collect()
-
-        metrics = performance_monitor.stop_monitoring()
+        workflow = _workflow_with_agents(mock_agents_for_workflow)
+
+        with perf() as monitor:
+            # Execute multiple workflows to stress test memory usage
+            workflows_to_test = [
+                ("feature-dev", "Create user management system"),
+                ("bug-fix", "Fix authentication bug"),
+                ("code-review", "Review security implementation"),
+                ("refactor", "Refactor authentication module"),
+            ]
+
+            results = []
+            for workflow_name, task in workflows_to_test:
+                result = workflow.execute_workflow(workflow_name, task)
+                results.append(result)
+
+            # Collect once after the runs rather than between each workflow
+            gc.collect()
+        metrics = monitor.metrics
 
         # Verify memory benchmark (4GB = 4096 MB)
         assert (
@@ -527,36 +486,35 @@ class TestMemoryUsageBenchmarks:
         for result in results:
             assert result.success is True
 
-        print(
-            f"Memory Usage Test: Peak {metrics['peak_memory_mb']:.1f}MB, Total time: {metrics['execution_time']:.2f}s"
-        )
+        perf_log(metrics)
 
-    def test_concurrent_agent_memory_usage(self, mock_ollama_client, performance_monitor):
+    def test_concurrent_agent_memory_usage(self, mock_ollama_client, perf_log):
         """Test memory usage with concurrent agent operations."""
         import concurrent.futures
 
-        performance_monitor.start_monitoring()
-
-        def run_agent_task(agent_class, task, context):
-            agent = agent_class(model="test:model", ollama_client=mock_ollama_client)
-            return agent.execute(task, context)
-
-        # Create multiple concurrent tasks
-        tasks = [
-            (PlanningAgent, "Plan feature A", {"type": "feature"}),
-            (CodingAgent, "Code feature A", {"language": "python"}),
-            (TestingAgent, "Test feature A", {"framework": "pytest"}),
-            (ReviewAgent, "Review feature A", {"focus": "security"}),
-            (PlanningAgent, "Plan feature B", {"type": "enhancement"}),
-            (CodingAgent, "Code feature B", {"language": "javascript"}),
-        ]
-
-        # Execute tasks concurrently
-        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-            futures = [executor.submit(run_agent_task, *task) for task in tasks]
-            results = [future.result() for future in concurrent.futures.as_completed(futures)]
-
-        metrics = performance_monitor.stop_monitoring()
+        with perf() as monitor:
+
+            def run_agent_task(agent_class, task, context):
+                agent = agent_class(model="test:model", ollama_client=mock_ollama_client)
+                return agent.execute(task, context)
+
+            # Create multiple concurrent tasks
+            tasks = [
+                (PlanningAgent, "Plan feature A", {"type": "feature"}),
+                (CodingAgent, "Code feature A", {"language": "python"}),
+                (TestingAgent, "Test feature A", {"framework": "pytest"}),
+                (ReviewAgent, "Review feature A", {"focus": "security"}),
+                (PlanningAgent, "Plan feature B", {"type": "enhancement"}),
+                (CodingAgent, "Code feature B", {"language": "javascript"}),
+            ]
+
+            # Execute tasks concurrently
+            with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [executor.submit(run_agent_task, *task) for task in tasks]
+                # Wait once, failing fast, and read results in submission order
+                concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+                results = [future.result() for future in futures]
+        metrics = monitor.metrics
 
         # Verify memory stays reasonable under concurrent load
         assert (
@@ -567,34 +525,31 @@ class TestMemoryUsageBenchmarks:
         for result in results:
             assert result.success is True
 
-        print(
-            f"Concurrent Memory Test: Peak {metrics['peak_memory_mb']:.1f}MB, {len(tasks)} concurrent tasks"
-        )
+        perf_log(metrics, tasks=len(tasks))
+
+
+# Large context simulating a large codebase analysis, built once and only read
+_LARGE_CONTEXT = {
+    "existing_codebase": "large code content" * 1000,  # ~20KB of text
+    "requirements": [f"requirement {i}" for i in range(100)],
+    "constraints": [f"constraint {i}" for i in range(50)],
+    "architecture_docs": "architecture documentation" * 500,
+}
 
 
 class TestScalabilityBenchmarks:
     """Test system scalability under various loads."""
 
-    def test_large_context_processing_performance(self, mock_ollama_client, performance_monitor):
+    def test_large_context_processing_performance(self, mock_ollama_client, perf_log):
         """Test performance with large context inputs."""
         agent = PlanningAgent(model="test:model", ollama_client=mock_ollama_client)
 
-        # Create large context (simulating large codebase analysis)
-        large_context = {
-            "existing_codebase": "large code content" * 1000,  # ~20KB of text
-            "requirements": ["requirement " + str(i) for i in range(100)],
-            "constraints": ["constraint " + str(i) for i in range(50)],
-            "architecture_docs": "architecture documentation" * 500,
-        }
-
-        performance_monitor.start_monitoring()
-
-        result = agent.execute(
-            "Analyze existing large codebase and create comprehensive modernization plan",
-            large_context,
-        )
-
-        metrics = performance_monitor.stop_monitoring()
+        with perf() as monitor:
+            result = agent.execute(
+                "Analyze existing large codebase and create comprehensive modernization plan",
+                _LARGE_CONTEXT,
+            )
+        metrics = monitor.metrics
 
         # Should still meet planning benchmark even with large context
         assert (
@@ -602,53 +557,27 @@ class TestScalabilityBenchmarks:
         ), f"Large context processing took {metrics['execution_time']:.2f}s"
         assert result.success is True
 
-        print(
-            f"Large Context Processing: {metrics['execution_time']:.2f}s, Peak Memory: {metrics['peak_memory_mb']:.1f}MB"
-        )
+        perf_log(metrics)
 
-    def test_multiple_workflow_execution_performance(
-        self, mock_agents_for_workflow, performance_monitor
-    ):
+    def test_multiple_workflow_execution_performance(self, mock_agents_for_workflow, perf_log):
         """Test performance of multiple sequential workflow executions."""
-        workflow = Workflow()
-
-        performance_monitor.start_monitoring()
-
-        # Execute 5 workflows sequentially
-        workflows = [
-            ("code-review", "Review module A"),
-            ("bug-fix", "Fix bug in module A"),
-            ("code-review", "Review module B"),
-            ("feature-dev", "Add feature to module B"),
-            ("refactor", "Refactor modules A and B"),
-        ]
-
-        results = []
-        with patch.object(
-            PlanningAgent,
-            "__new__",
-            return_value=mock_agents_for_workflow["planner"],
-        ):
-            with patch.object(
-                CodingAgent,
-                "__new__",
-                return_value=mock_agents_for_workflow["coder"],
-            ):
-                with patch.object(
-                    TestingAgent,
-                    "__new__",
-                    return_value=mock_agents_for_workflow["tester"],
-                ):
-                    with patch.object(
-                        ReviewAgent,
-                        "__new__",
-                        return_value=mock_agents_for_workflow["reviewer"],
-                    ):
-                        for workflow_name, task in workflows:
-                            result = workflow.execute_workflow(workflow_name, task)
-                            results.append(result)
-
-        metrics = performance_monitor.stop_monitoring()
+        workflow = _workflow_with_agents(mock_agents_for_workflow)
+
+        with perf() as monitor:
+            # Execute 5 workflows sequentially
+            workflows = [
+                ("code-review", "Review module A"),
+                ("bug-fix", "Fix bug in module A"),
+                ("code-review", "Review module B"),
+                ("feature-dev", "Add feature to module B"),
+                ("refactor", "Refactor modules A and B"),
+            ]
+
+            results = []
+            for workflow_name, task in workflows:
+                result = workflow.execute_workflow(workflow_name, task)
+                results.append(result)
+        metrics = monitor.metrics
 
         # Total time should be reasonable for 5 workflows
         assert (
@@ -659,44 +588,31 @@ class TestScalabilityBenchmarks:
         for result in results:
             assert result.success is True
 
-        print(f"Multiple Workflows: {len(workflows)} workflows in {metrics['execution_time']:.2f}s")
+        perf_log(metrics, workflows=len(workflows))
 
 
-@pytest.mark.performance
 class TestPerformanceRegression:
     """Test for performance regressions."""
 
-    def test_baseline_performance_metrics(self, mock_ollama_client, performance_monitor):
-        """Establish baseline performance metrics for regression testing."""
-        baseline_metrics = {}
-
-        # Test each agent type
-        agents = [
+    @pytest.mark.parametrize(
+        "agent_class,task",
+        [
             (PlanningAgent, "Create implementation plan"),
             (CodingAgent, "Generate Python function"),
             (TestingAgent, "Create unit tests"),
             (ReviewAgent, "Review code quality"),
-        ]
-
-        for agent_class, task in agents:
-            agent = agent_class(model="test:model", ollama_client=mock_ollama_client)
+        ],
+        ids=["planning", "coding", "testing", "review"],
+    )
+    def test_baseline_performance_metrics(self, mock_ollama_client, perf_log, agent_class, task):
+        """Establish baseline performance metrics for regression testing."""
+        agent = agent_class(model="test:model", ollama_client=mock_ollama_client)
 
-            performance_monitor.start_monitoring()
+        with perf() as monitor:
             result = agent.execute(task)
-            metrics = performance_monitor.stop_monitoring()
-
-            agent_name = agent_class.__name__.lower()
-            baseline_metrics[agent_name] = {
-                "execution_time": metrics["execution_time"],
-                "memory_mb": metrics["peak_memory_mb"],
-            }
+        metrics = monitor.metrics
 
-            assert result.success is True
+        assert result.success is True
 
         # Log baseline metrics for future regression testing
-        print("Baseline Performance Metrics:")
-        for agent, metrics in baseline_metrics.items():
-            print(f"  {agent}: {metrics['execution_time']:.2f}s, {metrics['memory_mb']:.1f}MB")
-
-        # Store baseline for comparison (in real implementation, save to file)
-        return baseline_metrics
+        perf_log(metrics)
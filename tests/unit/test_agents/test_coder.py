@@ -2,30 +2,25 @@
 
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
 
 from local_agents.agents.coder import CodingAgent
 from local_agents.base import TaskResult
-from local_agents.ollama_client import OllamaClient
 
+_DEFAULT_RESPONSE = "```python\ndef hello():\n    return 'Hello, World!'\n```"
 
-class TestCodingAgent:
-    """Test CodingAgent class."""
 
-    @pytest.fixture
-    def mock_ollama_client(self):
-        """Create a mock Ollama client."""
-        client = Mock(spec=OllamaClient)
-        client.is_model_available.return_value = True
-        client.generate.return_value = "```python\ndef hello():\n    return 'Hello, World!'\n```"
-        return client
+@pytest.fixture
+def coder_agent(mock_ollama_client):
+    """Create a CodingAgent instance for testing."""
+    mock_ollama_client.generate.return_value = _DEFAULT_RESPONSE
+    return CodingAgent(model="test:model", ollama_client=mock_ollama_client)
 
-    @pytest.fixture
-    def coder_agent(self, mock_ollama_client):
-        """Create a CodingAgent instance for testing."""
-        return CodingAgent(model="test:model", ollama_client=mock_ollama_client)
+
+class TestCodingAgent:
+    """Test CodingAgent class."""
 
     def test_agent_initialization(self, coder_agent):
         """Test coding agent initialization."""
@@ -178,21 +173,15 @@ class TestCodingAgent:
         assert result.success is True
         assert f"Refactor code: {refactor_description}" in result.task
 
-    def test_multiple_language_support(self, coder_agent):
+    @pytest.mark.parametrize("language", ["python", "javascript", "java", "go", "rust"])
+    def test_multiple_language_support(self, coder_agent, language):
         """Test support for multiple programming languages."""
-        languages = ["python", "javascript", "java", "go", "rust"]
-
-        for language in languages:
-            task = f"Create hello world in {language}"
-            context = {"language": language}
+        task = f"Create hello world in {language}"
+        context = {"language": language}
 
-            result = coder_agent.execute(task, context)
+        prompt = coder_agent._build_coding_prompt(task, context)
 
-            assert result.success is True
-            # Verify language appears in the prompt
-            call_args = coder_agent.ollama_client.generate.call_args
-            prompt = call_args.kwargs["prompt"]
-            assert f"Language: {language}" in prompt
+        assert f"Language: {language}" in prompt
 
     def test_code_style_guidelines(self, coder_agent):
         """Test that coding prompts include style guidelines."""
@@ -203,11 +192,8 @@ class TestCodingAgent:
             "docstring_style": "Google",
         }
 
-        result = coder_agent.execute(task, context)
+        prompt = coder_agent._build_coding_prompt(task, context)
 
-        assert result.success is True
-        call_args = coder_agent.ollama_client.generate.call_args
-        prompt = call_args.kwargs["prompt"]
         assert "PEP 8" in prompt
         assert "Google" in prompt
 
@@ -232,22 +218,21 @@ class TestCodingAgent:
         mock_get_model.assert_called_with("code")
         assert agent.model == "codellama:7b"
 
-    def test_framework_specific_prompts(self, coder_agent):
-        """Test framework-specific prompt generation."""
-        frameworks = [
+    @pytest.mark.parametrize(
+        "context",
+        [
             {"language": "python", "framework": "django"},
             {"language": "javascript", "framework": "react"},
             {"language": "java", "framework": "spring"},
-        ]
-
-        for context in frameworks:
-            task = f"Create API endpoint using {context['framework']}"
-            result = coder_agent.execute(task, context)
+        ],
+        ids=["django", "react", "spring"],
+    )
+    def test_framework_specific_prompts(self, coder_agent, context):
+        """Test framework-specific prompt generation."""
+        task = f"Create API endpoint using {context['framework']}"
+        prompt = coder_agent._build_coding_prompt(task, context)
 
-            assert result.success is True
-            call_args = coder_agent.ollama_client.generate.call_args
-            prompt = call_args.kwargs["prompt"]
-            assert context["framework"] in prompt.lower()
+        assert context["framework"] in prompt.lower()
 
     def test_code_review_integration_context(self, coder_agent):
         """Test that coding agent can use code review feedback."""
@@ -259,11 +244,8 @@ class TestCodingAgent:
             "suggestions": ["Use try-except", "Validate inputs"],
         }
 
-        result = coder_agent.execute(task, context)
+        prompt = coder_agent._build_coding_prompt(task, context)
 
-        assert result.success is True
-        call_args = coder_agent.ollama_client.generate.call_args
-        prompt = call_args.kwargs["prompt"]
         assert "review_feedback" in prompt.lower() or "review feedback" in prompt
         assert "division by zero" in prompt
 
@@ -327,11 +309,8 @@ This is the main plan content with detailed steps:
         task = "Implement user authentication"
         context = {"plan_content": "1. Create User model\n2. Add authentication middleware"}
 
-        result = coder_agent.execute(task, context)
+        prompt = coder_agent._build_coding_prompt(task, context)
 
-        assert result.success is True
-        call_args = coder_agent.ollama_client.generate.call_args
-        prompt = call_args.kwargs["prompt"]
         assert "Implementation Plan" in prompt
         assert "Create User model" in prompt
         assert "authentication middleware" in prompt
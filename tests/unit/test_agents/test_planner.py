@@ -1,31 +1,55 @@
 """Tests for the planning agent."""
 
-import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
 
 from local_agents.agents.planner import PlanningAgent
 from local_agents.base import TaskResult
-from local_agents.ollama_client import OllamaClient
 
+_DEFAULT_RESPONSE = "Generated plan content"
+_LONG_TASK = "Create a very long task description that might exceed the filename length limit" * 5
 
-class TestPlanningAgent:
-    """Test PlanningAgent class."""
 
-    @pytest.fixture
-    def mock_ollama_client(self):
-        """Create a mock Ollama client."""
-        client = Mock(spec=OllamaClient)
-        client.is_model_available.return_value = True
-        client.generate.return_value = "Generated plan content"
-        return client
+@pytest.fixture(scope="class")
+def plan_dir(tmp_path_factory):
+    """Create one plan output directory per test class."""
+    return str(tmp_path_factory.mktemp("plans"))
+
+
+@pytest.fixture(autouse=True, scope="class")
+def _patched_config():
+    """Patch ``get_config`` once per test class; ``plan_config`` tunes the returned Mock."""
+    with patch("local_agents.config.get_config") as mock_config:
+        yield mock_config
+
 
-    @pytest.fixture
-    def planner_agent(self, mock_ollama_client):
-        """Create a PlanningAgent instance for testing."""
-        return PlanningAgent(model="test:model", ollama_client=mock_ollama_client)
+@pytest.fixture(autouse=True)
+def plan_config(_patched_config, plan_dir):
+    """Restore the patched plan output config to defaults and return it.
+
+    Tests adjust individual attributes before executing the planner.
+    """
+    cfg = _patched_config.return_value.plan_output
+    cfg.enable_file_output = True
+    cfg.output_directory = plan_dir
+    cfg.filename_format = "plan_{timestamp}_{task_hash}.md"
+    cfg.include_context_in_filename = False
+    cfg.max_filename_length = 255
+    cfg.preserve_plans = True
+    return cfg
+
+
+@pytest.fixture
+def planner_agent(mock_ollama_client):
+    """Create a PlanningAgent instance for testing."""
+    mock_ollama_client.generate.return_value = _DEFAULT_RESPONSE
+    return PlanningAgent(model="test:model", ollama_client=mock_ollama_client)
+
+
+class TestPlanningAgent:
+    """Test PlanningAgent class."""
 
     def test_agent_initialization(self, planner_agent):
         """Test planning agent initialization."""
@@ -43,7 +67,7 @@ class TestPlanningAgent:
 
         assert isinstance(result, TaskResult)
         assert result.success is True
-        assert result.output == "Generated plan content"
+        assert result.output == _DEFAULT_RESPONSE
         assert result.agent_type == "plan"
         assert result.task == task
         # Context should contain original context plus plan file info
@@ -147,158 +171,97 @@ class TestPlanningAgent:
         mock_get_model.assert_called_with("plan")
         assert agent.model == "llama3.1:8b"
 
-    def test_context_types_in_prompt(self, planner_agent):
+    @pytest.mark.parametrize("plan_type", ["feature", "bugfix", "refactor"])
+    def test_context_types_in_prompt(self, planner_agent, plan_type):
         """Test different context types are handled in prompt."""
-        contexts = [
-            {"plan_type": "feature"},
-            {"plan_type": "bugfix"},
-            {"plan_type": "refactor"},
-        ]
-
-        for context in contexts:
-            task = "Test task"
-            result = planner_agent.execute(task, context)
-            assert result.success is True
-            # Context should contain original context plus plan file info
-            assert result.context["plan_type"] == context["plan_type"]
-            assert "plan_file" in result.context
-            assert "plan_content" in result.context
-
-    def test_plan_file_output_disabled(self, planner_agent):
+        task = "Test task"
+        result = planner_agent.execute(task, {"plan_type": plan_type})
+        assert result.success is True
+        # Context should contain original context plus plan file info
+        assert result.context["plan_type"] == plan_type
+        assert "plan_file" in result.context
+        assert "plan_content" in result.context
+
+    def test_plan_file_output_disabled(self, planner_agent, plan_config):
         """Test plan execution when file output is disabled."""
         task = "Create a test plan"
         context = {"file_content": "test content"}
+        plan_config.enable_file_output = False
 
-        with patch("local_agents.config.get_config") as mock_config:
-            mock_plan_config = Mock()
-            mock_plan_config.enable_file_output = False
-            mock_config.return_value.plan_output = mock_plan_config
-
-            result = planner_agent.execute(task, context)
+        result = planner_agent.execute(task, context)
 
-            assert result.success is True
-            assert "plan_file" not in result.context
-            assert "plan_content" not in result.context
+        assert result.success is True
+        assert "plan_file" not in result.context
+        assert "plan_content" not in result.context
 
-    def test_plan_file_output_enabled(self, planner_agent):
+    def test_plan_file_output_enabled(self, planner_agent, plan_config):
         """Test plan execution when file output is enabled."""
         task = "Create a test plan"
         context = {"file_content": "test content"}
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with patch("local_agents.config.get_config") as mock_config:
-                mock_plan_config = Mock()
-                mock_plan_config.enable_file_output = True
-                mock_plan_config.output_directory = temp_dir
-                mock_plan_config.filename_format = "plan_{timestamp}_{task_hash}.md"
-                mock_plan_config.include_context_in_filename = False
-                mock_plan_config.max_filename_length = 255
-                mock_plan_config.preserve_plans = True
-                mock_config.return_value.plan_output = mock_plan_config
-
-                result = planner_agent.execute(task, context)
-
-                assert result.success is True
-                assert "plan_file" in result.context
-                assert "plan_content" in result.context
-                assert result.context["plan_content"] == "Generated plan content"
-
-                # Check that the file was actually created
-                plan_file_path = Path(result.context["plan_file"])
-                assert plan_file_path.exists()
-                assert plan_file_path.suffix == ".md"
-
-    def test_plan_file_content_format(self, planner_agent):
+        result = planner_agent.execute(task, context)
+
+        assert result.success is True
+        assert "plan_file" in result.context
+        assert "plan_content" in result.context
+        assert result.context["plan_content"] == _DEFAULT_RESPONSE
+
+        # Check that the file was actually created
+        plan_file_path = Path(result.context["plan_file"])
+        assert plan_file_path.exists()
+        assert plan_file_path.suffix == ".md"
+
+    def test_plan_file_content_format(self, planner_agent, plan_config):
         """Test the format of the generated plan file."""
         task = "Create a test plan"
         context = {"plan_type": "feature", "directory": "/test/dir"}
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with patch("local_agents.config.get_config") as mock_config:
-                mock_plan_config = Mock()
-                mock_plan_config.enable_file_output = True
-                mock_plan_config.output_directory = temp_dir
-                mock_plan_config.filename_format = "plan_{timestamp}_{task_hash}.md"
-                mock_plan_config.include_context_in_filename = False
-                mock_plan_config.max_filename_length = 255
-                mock_plan_config.preserve_plans = True
-                mock_config.return_value.plan_output = mock_plan_config
-
-                result = planner_agent.execute(task, context)
-                plan_file_path = Path(result.context["plan_file"])
-                file_content = plan_file_path.read_text(encoding="utf-8")
-
-                # Check metadata section
-                assert "# Planning Session Metadata" in file_content
-                assert f"- **Task**: {task}" in file_content
-                assert f"- **Model**: {planner_agent.model}" in file_content
-                assert "- **Plan Type**: feature" in file_content
-                assert "- **Working Directory**: /test/dir" in file_content
-
-                # Check plan section
-                assert "# Implementation Plan" in file_content
-                assert "Generated plan content" in file_content
-
-    def test_plan_filename_with_context(self, planner_agent):
+        result = planner_agent.execute(task, context)
+        plan_file_path = Path(result.context["plan_file"])
+        file_content = plan_file_path.read_text(encoding="utf-8")
+
+        # Check metadata section
+        assert "# Planning Session Metadata" in file_content
+        assert f"- **Task**: {task}" in file_content
+        assert f"- **Model**: {planner_agent.model}" in file_content
+        assert "- **Plan Type**: feature" in file_content
+        assert "- **Working Directory**: /test/dir" in file_content
+
+        # Check plan section
+        assert "# Implementation Plan" in file_content
+        assert _DEFAULT_RESPONSE in file_content
+
+    def test_plan_filename_with_context(self, planner_agent, plan_config):
         """Test plan filename generation with context information."""
         task = "Create a feature plan"
         context = {"plan_type": "feature"}
+        plan_config.include_context_in_filename = True
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with patch("local_agents.config.get_config") as mock_config:
-                mock_plan_config = Mock()
-                mock_plan_config.enable_file_output = True
-                mock_plan_config.output_directory = temp_dir
-                mock_plan_config.filename_format = "plan_{timestamp}_{task_hash}.md"
-                mock_plan_config.include_context_in_filename = True
-                mock_plan_config.max_filename_length = 255
-                mock_plan_config.preserve_plans = True
-                mock_config.return_value.plan_output = mock_plan_config
-
-                result = planner_agent.execute(task, context)
-                plan_file_path = Path(result.context["plan_file"])
+        result = planner_agent.execute(task, context)
+        plan_file_path = Path(result.context["plan_file"])
 
-                assert "_feature.md" in plan_file_path.name
+        assert "_feature.md" in plan_file_path.name
 
-    def test_plan_filename_length_limitation(self, planner_agent):
+    def test_plan_filename_length_limitation(self, planner_agent, plan_config):
         """Test plan filename length is properly limited."""
-        task = "Create a very long task description that might exceed the filename length limit" * 5
+        task = _LONG_TASK
         context = {"plan_type": "feature"}
+        plan_config.max_filename_length = 50
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with patch("local_agents.config.get_config") as mock_config:
-                mock_plan_config = Mock()
-                mock_plan_config.enable_file_output = True
-                mock_plan_config.output_directory = temp_dir
-                mock_plan_config.filename_format = "plan_{timestamp}_{task_hash}.md"
-                mock_plan_config.include_context_in_filename = False
-                mock_plan_config.max_filename_length = 50
-                mock_plan_config.preserve_plans = True
-                mock_config.return_value.plan_output = mock_plan_config
-
-                result = planner_agent.execute(task, context)
-                plan_file_path = Path(result.context["plan_file"])
+        result = planner_agent.execute(task, context)
+        plan_file_path = Path(result.context["plan_file"])
 
-                assert len(plan_file_path.name) <= 50
+        assert len(plan_file_path.name) <= 50
 
-    def test_plan_file_creation_error_handling(self, planner_agent):
+    def test_plan_file_creation_error_handling(self, planner_agent, plan_config):
         """Test error handling when plan file creation fails."""
         task = "Create a test plan"
         context = {}
+        plan_config.output_directory = "/invalid/path/that/does/not/exist"
+
+        # Should not crash, but should not include plan_file in result
+        result = planner_agent.execute(task, context)
 
-        with patch("local_agents.config.get_config") as mock_config:
-            mock_plan_config = Mock()
-            mock_plan_config.enable_file_output = True
-            mock_plan_config.output_directory = "/invalid/path/that/does/not/exist"
-            mock_plan_config.filename_format = "plan_{timestamp}_{task_hash}.md"
-            mock_plan_config.include_context_in_filename = False
-            mock_plan_config.max_filename_length = 255
-            mock_plan_config.preserve_plans = True
-            mock_config.return_value.plan_output = mock_plan_config
-
-            # Should not crash, but should not include plan_file in result
-            result = planner_agent.execute(task, context)
-
-            assert result.success is True
-            # File creation failed, so these should not be in context
-            assert "plan_file" not in result.context or result.context["plan_file"] is None
+        assert result.success is True
+        # File creation failed, so these should not be in context
+        assert "plan_file" not in result.context or result.context["plan_file"] is None
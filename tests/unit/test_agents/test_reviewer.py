@@ -229,12 +229,10 @@ The code is well-structured with good error handling practices.
         assert "maintainability" in prompt.lower()
 
     @patch("local_agents.agents.reviewer.ReviewAgent._run_static_analysis")
-    def test_static_analysis_integration(
-        self, mock_static_analysis, reviewer_agent, temp_directory
-    ):
+    def test_static_analysis_integration(self, mock_static_analysis, reviewer_agent, tmp_path):
         """Test static analysis integration."""
         # Create test file
-        test_file = temp_directory / "test_code.py"
+        test_file = tmp_path / "test_code.py"
         test_file.write_text("def test(): pass")
 
         # Mock static analysis results
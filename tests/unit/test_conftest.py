@@ -0,0 +1,46 @@
+"""Tests for the shared pytest configuration in ``tests/conftest.py``."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+BENCHMARKS = PROJECT_ROOT / "tests" / "performance"
+
+
+def _collect_benchmarks(*args):
+    """Collect the benchmark module in a fresh pytest process and return its output."""
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider"]
+        + list(args)
+        + [str(BENCHMARKS)],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    return result.stdout
+
+
+class TestPerformanceDeselection:
+    """Test that benchmarks only run when the marker expression asks for them."""
+
+    @pytest.mark.parametrize(
+        "markexpr",
+        [None, "not slow", "not slow and not hardware"],
+        ids=["no-m", "not-slow", "not-slow-not-hardware"],
+    )
+    def test_benchmarks_deselected(self, markexpr):
+        """Test that benchmarks stay out without -m or with an unrelated -m."""
+        output = _collect_benchmarks(*(["-m", markexpr] if markexpr else []))
+
+        assert "test_benchmarks.py::" not in output
+        assert "deselected" in output
+
+    def test_benchmarks_selected_by_marker(self):
+        """Test that -m performance collects the benchmarks."""
+        output = _collect_benchmarks("-m", "performance")
+
+        assert "test_benchmarks.py::" in output